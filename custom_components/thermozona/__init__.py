@@ -407,6 +407,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data[DOMAIN][entry.entry_id] = validated_config
 
+    # One controller per entry, shared by every platform through runtime_data.
+    # Imported here because heat_pump imports constants from this package.
+    from .heat_pump import HeatPumpController
+
+    entry.runtime_data = HeatPumpController(hass, validated_config)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -414,10 +420,5 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok and DOMAIN in hass.data:
-        controllers = hass.data[DOMAIN].get("controllers")
-        if controllers:
-            controllers.pop(entry.entry_id, None)
-            if not controllers:
-                hass.data[DOMAIN].pop("controllers")
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
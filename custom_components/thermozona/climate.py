@@ -39,13 +39,7 @@ async def async_setup_entry(
     zones = entry_config.get("zones", {})
     _LOGGER.debug("Found zones: %s", zones)
 
-    controllers = domain_data.setdefault("controllers", {})
-    controller = controllers.get(config_entry.entry_id)
-    if controller is None:
-        controller = HeatPumpController(hass, entry_config)
-    else:
-        controller.refresh_entry_config(entry_config)
-    controllers[config_entry.entry_id] = controller
+    controller: HeatPumpController = config_entry.runtime_data
 
     entities: list[ThermozonaThermostat] = []
     for zone_name, config in zones.items():
@@ -1,13 +1,16 @@
 """Heat pump controller for the Thermozona integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import weakref
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, TYPE_CHECKING
+from typing import Any, NamedTuple, TYPE_CHECKING
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.climate import HVACMode
+from homeassistant.helpers.event import async_track_state_change_event
 
 from . import (
     CONTROL_MODE_PWM,
@@ -42,8 +45,9 @@ from . import (
     DOMAIN,
     FLOW_MODE_PRO_SUPERVISOR,
     FLOW_MODE_SIMPLE,
+    ZONE_RESPONSE_FAST,
 )
-from .helpers import resolve_circuits
+from .helpers import resolve_circuits, round_tenth
 from .licensing import LicenseValidationResult
 from .licensing import normalize_license_key
 from .licensing import validate_pro_license_key
@@ -61,6 +65,49 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw heat pump mode entity states mapped to the controller's modes.
+_MODE_MAP = {
+    "off": "off",
+    "idle": "off",
+    "heat": "heat",
+    "heating": "heat",
+    "cool": "cool",
+    "cooling": "cool",
+    "auto": "auto",
+    "automatic": "auto",
+}
+
+
+class _FlowSettings(NamedTuple):
+    """Entry options read by every flow tick, parsed once per config change."""
+
+    heating_base_offset: float
+    heating_weather_slope: float
+    cooling_base_offset: float
+    cooling_weather_slope: float
+    preheat_enabled: bool
+    preheat_forecast_sensor: str | None
+    preheat_solar_sensor: str | None
+    pro_write_deadband: float
+    pro_write_min_interval: timedelta
+    simple_write_deadband: float
+    simple_write_min_interval: timedelta
+    outside_temp_sensor: str | None
+    flow_temp_entity: str | None
+
+
+@dataclass(slots=True)
+class ZoneStatus:
+    """Latest coerced status reported by a zone, updated in place."""
+
+    target: float
+    current: float
+    active: bool = False
+    duty_cycle: float | None = None
+    fast_response: bool = False
+    zone_flow_weight: float = 1.0
+    zone_solar_weight: float = 1.0
+
 
 class HeatPumpController:
     """Coordinate state updates for the shared heat pump."""
@@ -68,7 +115,9 @@ class HeatPumpController:
     def __init__(self, hass: HomeAssistant, entry_config: dict[str, Any]) -> None:
         self._hass = hass
         self._entry_config = entry_config
-        self._zone_status: dict[str, dict[str, Any]] = {}
+        self._zone_status: dict[str, ZoneStatus] = {}
+        # Running sum of (current - target) over _zone_status for auto mode.
+        self._delta_sum = 0.0
         self._last_auto_mode: HVACMode = HVACMode.HEAT
         self._thermostats: weakref.WeakSet[ThermozonaThermostat] = weakref.WeakSet()
         self._pwm_zone_indices: weakref.WeakKeyDictionary[ThermozonaThermostat, int] = weakref.WeakKeyDictionary()
@@ -100,6 +149,13 @@ class HeatPumpController:
         )
         self._mode_value: str = "auto"
         self._mode_entity_id: str | None = None
+        self._remove_mode_listener = None
+        self._mode_listener_entity: str | None = None
+        self._mode_cache: tuple[str, str] | None = None
+        self._active_circuits: set[str] = set()
+        self._pump_update_dirty = False
+        self._pump_update_task: asyncio.Task[None] | None = None
+        self._remove_circuit_listener = None
         self._pump_state: str = "idle"
         self._last_any_circuit_on: datetime | None = None
         self._demand_off_delay = timedelta(minutes=5)
@@ -108,6 +164,11 @@ class HeatPumpController:
             notify_thermostats=lambda: self._notify_thermostats(),
         )
         self._pro_flow_supervisor = ProFlowSupervisor()
+        self._pro_supervisor_config = ProFlowSupervisor.prepare_config(
+            self._pro_flow_config()
+        )
+        self._flow_settings = self._build_flow_settings()
+        self._all_circuits = self._build_all_circuits()
 
     @property
     def pro_enabled(self) -> bool:
@@ -160,17 +221,67 @@ class HeatPumpController:
 
         self._flow_mode = requested_flow_mode
 
-    def _get_flow_write_settings(self) -> tuple[float, timedelta]:
-        """Return deadband and minimum write interval for flow commands."""
-        if self.flow_mode == FLOW_MODE_PRO_SUPERVISOR:
-            config = self._pro_flow_config()
-            deadband_default = DEFAULT_PRO_WRITE_DEADBAND_C
-            min_interval_default = DEFAULT_PRO_WRITE_MIN_INTERVAL_MINUTES
-        else:
-            config = self._entry_config.get(CONF_SIMPLE_FLOW, {})
-            deadband_default = DEFAULT_SIMPLE_WRITE_DEADBAND_C
-            min_interval_default = DEFAULT_SIMPLE_WRITE_MIN_INTERVAL_MINUTES
+    def _build_flow_settings(self) -> _FlowSettings:
+        """Parse the entry options used on every flow tick."""
+        pro_flow_config = self._pro_flow_config()
+        simple_flow_config = self._entry_config.get(CONF_SIMPLE_FLOW, {})
+        pro_deadband, pro_min_interval = self._parse_flow_write_settings(
+            pro_flow_config,
+            DEFAULT_PRO_WRITE_DEADBAND_C,
+            DEFAULT_PRO_WRITE_MIN_INTERVAL_MINUTES,
+        )
+        simple_deadband, simple_min_interval = self._parse_flow_write_settings(
+            simple_flow_config,
+            DEFAULT_SIMPLE_WRITE_DEADBAND_C,
+            DEFAULT_SIMPLE_WRITE_MIN_INTERVAL_MINUTES,
+        )
+        return _FlowSettings(
+            heating_base_offset=float(
+                self._entry_config.get(
+                    CONF_HEATING_BASE_OFFSET,
+                    DEFAULT_HEATING_BASE_OFFSET,
+                )
+            ),
+            heating_weather_slope=float(
+                self._entry_config.get(
+                    CONF_WEATHER_SLOPE_HEAT,
+                    DEFAULT_WEATHER_SLOPE_HEAT,
+                )
+            ),
+            cooling_base_offset=float(
+                self._entry_config.get(
+                    CONF_COOLING_BASE_OFFSET,
+                    DEFAULT_COOLING_BASE_OFFSET,
+                )
+            ),
+            cooling_weather_slope=float(
+                self._entry_config.get(
+                    CONF_WEATHER_SLOPE_COOL,
+                    DEFAULT_WEATHER_SLOPE_COOL,
+                )
+            ),
+            preheat_enabled=bool(
+                pro_flow_config.get(CONF_PRO_PREHEAT_ENABLED, False)
+            ),
+            preheat_forecast_sensor=pro_flow_config.get(
+                CONF_PRO_PREHEAT_FORECAST_SENSOR
+            ),
+            preheat_solar_sensor=pro_flow_config.get(CONF_PRO_PREHEAT_SOLAR_SENSOR),
+            pro_write_deadband=pro_deadband,
+            pro_write_min_interval=pro_min_interval,
+            simple_write_deadband=simple_deadband,
+            simple_write_min_interval=simple_min_interval,
+            outside_temp_sensor=self._entry_config.get(CONF_OUTSIDE_TEMP_SENSOR),
+            flow_temp_entity=self._entry_config.get(CONF_FLOW_TEMP_SENSOR),
+        )
 
+    @staticmethod
+    def _parse_flow_write_settings(
+        config: dict[str, Any],
+        deadband_default: float,
+        min_interval_default: int,
+    ) -> tuple[float, timedelta]:
+        """Return (deadband, minimum write interval) from a flow config block."""
         deadband = max(
             0.0,
             float(config.get(CONF_WRITE_DEADBAND_C, deadband_default)),
@@ -181,6 +292,13 @@ class HeatPumpController:
         )
         return deadband, timedelta(minutes=min_interval_minutes)
 
+    def _get_flow_write_settings(self) -> tuple[float, timedelta]:
+        """Return deadband and minimum write interval for flow commands."""
+        settings = self._flow_settings
+        if self.flow_mode == FLOW_MODE_PRO_SUPERVISOR:
+            return settings.pro_write_deadband, settings.pro_write_min_interval
+        return settings.simple_write_deadband, settings.simple_write_min_interval
+
     def _should_dispatch_flow_temperature(
         self,
         *,
@@ -211,10 +329,10 @@ class HeatPumpController:
         return self._pro_config().get(CONF_PRO_FLOW, {})
 
     def _outside_temp_sensor(self) -> str | None:
-        return self._entry_config.get(CONF_OUTSIDE_TEMP_SENSOR)
+        return self._flow_settings.outside_temp_sensor
 
     def _flow_temp_entity(self) -> str | None:
-        return self._entry_config.get(CONF_FLOW_TEMP_SENSOR)
+        return self._flow_settings.flow_temp_entity
 
     def _flow_temp_number(self) -> ThermozonaFlowTemperatureNumber | None:
         if self._flow_number is None:
@@ -308,8 +426,12 @@ class HeatPumpController:
             entity.set_calculated_value(self._last_flow_temp)
 
     def get_flow_temperature_factors(self) -> dict[str, Any]:
-        """Return the latest flow-temperature breakdown attributes."""
-        return dict(self._last_flow_factors) if self._last_flow_factors else {}
+        """Return the latest flow-temperature breakdown attributes.
+
+        The mapping is shared and must be treated as read-only; the same object
+        is returned until the breakdown actually changes.
+        """
+        return self._last_flow_factors
 
     def unregister_flow_temperature_sensor(
         self, entity: ThermozonaFlowTemperatureSensor
@@ -354,8 +476,7 @@ class HeatPumpController:
         self._mode_select = weakref.ref(entity)
         self._mode_entity_id = entity.entity_id
         entity.update_current_option(self._mode_value)
-        for thermostat in list(self._thermostats):
-            self._hass.async_create_task(thermostat.async_update_mode_listener())
+        self._update_mode_listener()
 
     def unregister_mode_select(
         self, entity: ThermozonaHeatPumpModeSelect
@@ -364,8 +485,7 @@ class HeatPumpController:
         if self._mode_select is not None and self._mode_select() is entity:
             self._mode_select = None
             self._mode_entity_id = None
-            for thermostat in list(self._thermostats):
-                self._hass.async_create_task(thermostat.async_update_mode_listener())
+            self._update_mode_listener()
 
     def set_mode_value(self, value: str) -> None:
         """Store a new mode value coming from the select entity."""
@@ -394,12 +514,17 @@ class HeatPumpController:
         _LOGGER.debug("%s: Heat pump mode set to %s", DOMAIN, normalized)
         self._notify_thermostats()
 
-    def get_all_circuit_entities(self) -> list[str]:
+    def get_all_circuit_entities(self) -> tuple[str, ...]:
         """Return all circuit entities across the configured zones."""
-        circuits: list[str] = []
-        for zone_config in self._entry_config.get(CONF_ZONES, {}).values():
-            circuits.extend(resolve_circuits(zone_config))
-        return circuits
+        return self._all_circuits
+
+    def _build_all_circuits(self) -> tuple[str, ...]:
+        """Flatten the configured zone circuits once per entry config."""
+        return tuple(
+            circuit
+            for zone_config in self._entry_config.get(CONF_ZONES, {}).values()
+            for circuit in resolve_circuits(zone_config)
+        )
 
     def get_operation_mode(self) -> str:
         """Return the current heat pump operation mode (heat/cool/auto)."""
@@ -415,23 +540,23 @@ class HeatPumpController:
             _LOGGER.warning("%s: Heat pump mode entity %s not found", DOMAIN, mode_entity)
             return "auto"
 
-        value = state.state.lower()
-        if value in {"off", "idle"}:
-            return "off"
-        if value in {"heat", "heating"}:
-            return "heat"
-        if value in {"cool", "cooling"}:
-            return "cool"
-        if value in {"auto", "automatic"}:
-            return "auto"
+        raw = state.state
+        cached = self._mode_cache
+        if cached is not None and cached[0] == raw:
+            return cached[1]
 
-        _LOGGER.debug(
-            "%s: Heat pump mode %s unknown (state=%s), defaulting to auto",
-            DOMAIN,
-            mode_entity,
-            state.state,
-        )
-        return "auto"
+        mode = _MODE_MAP.get(raw.lower())
+        if mode is None:
+            _LOGGER.debug(
+                "%s: Heat pump mode %s unknown (state=%s), defaulting to auto",
+                DOMAIN,
+                mode_entity,
+                raw,
+            )
+            mode = "auto"
+        # Keyed by the raw state, so a mode change simply misses the cache.
+        self._mode_cache = (raw, mode)
+        return mode
 
     @property
     def mode_entity(self) -> str | None:
@@ -455,28 +580,46 @@ class HeatPumpController:
     ) -> None:
         """Store latest temperature/target info for the zone."""
         if target is None or current is None:
-            self._zone_status.pop(zone_name, None)
+            removed = self._zone_status.pop(zone_name, None)
+            temperatures_changed = removed is not None
+            if removed is not None:
+                self._remove_zone_delta(removed)
         else:
-            entry = self._zone_status.setdefault(zone_name, {})
-            entry["target"] = float(target)
-            entry["current"] = float(current)
+            target_value = float(target)
+            current_value = float(current)
+            entry = self._zone_status.get(zone_name)
+            if entry is None:
+                entry = ZoneStatus(target=target_value, current=current_value)
+                self._zone_status[zone_name] = entry
+                self._delta_sum += current_value - target_value
+                temperatures_changed = True
+            else:
+                temperatures_changed = (
+                    entry.target != target_value or entry.current != current_value
+                )
+                if temperatures_changed:
+                    self._delta_sum += (current_value - target_value) - (
+                        entry.current - entry.target
+                    )
+                    entry.target = target_value
+                    entry.current = current_value
             if active is not None:
-                entry["active"] = bool(active)
+                entry.active = bool(active)
             if duty_cycle is not None:
-                entry["duty_cycle"] = max(0.0, min(100.0, float(duty_cycle)))
-            elif active is not None and "duty_cycle" not in entry:
-                entry["duty_cycle"] = 100.0 if active else 0.0
+                entry.duty_cycle = max(0.0, min(100.0, float(duty_cycle)))
+            elif active is not None and entry.duty_cycle is None:
+                entry.duty_cycle = 100.0 if active else 0.0
             if zone_response is not None:
-                entry["zone_response"] = str(zone_response).lower()
+                # Anything other than "fast" falls back to slow behaviour.
+                entry.fast_response = str(zone_response).lower() == ZONE_RESPONSE_FAST
             if zone_flow_weight is not None:
-                entry["zone_flow_weight"] = max(0.0, float(zone_flow_weight))
+                entry.zone_flow_weight = max(0.0, float(zone_flow_weight))
             if zone_solar_weight is not None:
-                entry["zone_solar_weight"] = max(0.0, float(zone_solar_weight))
-
-        if active is not None and zone_name in self._zone_status:
-            self._zone_status[zone_name]["active"] = bool(active)
+                entry.zone_solar_weight = max(0.0, float(zone_solar_weight))
 
-        if self.get_operation_mode() == "auto":
+        # Auto mode only depends on zone targets and temperatures, so the
+        # active/duty refresh at the end of a control pass skips the re-check.
+        if temperatures_changed and self.get_operation_mode() == "auto":
             previous_mode = self._last_auto_mode
             new_mode = self.determine_auto_mode()
             if new_mode != previous_mode:
@@ -491,19 +634,12 @@ class HeatPumpController:
 
     def determine_auto_mode(self) -> HVACMode:
         """Decide between heating or cooling when pump is in auto mode."""
-        if not self._zone_status:
+        zone_count = len(self._zone_status)
+        if not zone_count:
             self._last_auto_mode = HVACMode.HEAT
             return self._last_auto_mode
 
-        deltas: list[float] = []
-        for status in self._zone_status.values():
-            deltas.append(status["current"] - status["target"])
-
-        if not deltas:
-            self._last_auto_mode = HVACMode.HEAT
-            return self._last_auto_mode
-
-        avg_delta = sum(deltas) / len(deltas)
+        avg_delta = self._delta_sum / zone_count
         # Small deadband to avoid rapid toggling around the setpoint
         if avg_delta > 0.2:
             self._last_auto_mode = HVACMode.COOL
@@ -512,20 +648,41 @@ class HeatPumpController:
 
         return self._last_auto_mode
 
-    def _relevant_statuses(self) -> list[dict[str, Any]]:
-        """Return active zone statuses, or all zones when none are active."""
-        active_statuses = [
-            status for status in self._zone_status.values() if status.get("active")
-        ]
-        return active_statuses or list(self._zone_status.values())
+    def _remove_zone_delta(self, status: ZoneStatus) -> None:
+        """Drop a removed zone from the running auto-mode delta sum."""
+        if not self._zone_status:
+            # Reset instead of subtracting so rounding error cannot linger.
+            self._delta_sum = 0.0
+            return
+        self._delta_sum -= status.current - status.target
+
+    def _relevant_target_range(self) -> tuple[float, float] | None:
+        """Return (min, max) target over active zones, else over all zones."""
+        active_min = active_max = any_min = any_max = None
+        for status in self._zone_status.values():
+            target = status.target
+            if any_min is None or target < any_min:
+                any_min = target
+            if any_max is None or target > any_max:
+                any_max = target
+            if status.active:
+                if active_min is None or target < active_min:
+                    active_min = target
+                if active_max is None or target > active_max:
+                    active_max = target
+        if active_min is not None:
+            return active_min, active_max
+        if any_min is not None:
+            return any_min, any_max
+        return None
 
     def _forecast_outside_temp(self) -> float | None:
         """Return forecasted outside temperature used by optional preheat boost."""
-        pro_flow_config = self._pro_flow_config()
-        if not bool(pro_flow_config.get(CONF_PRO_PREHEAT_ENABLED, False)):
+        settings = self._flow_settings
+        if not settings.preheat_enabled:
             return None
 
-        forecast_sensor = pro_flow_config.get(CONF_PRO_PREHEAT_FORECAST_SENSOR)
+        forecast_sensor = settings.preheat_forecast_sensor
         if not forecast_sensor:
             return None
 
@@ -551,11 +708,11 @@ class HeatPumpController:
 
     def _forecast_solar_irradiance(self) -> float | None:
         """Return forecast solar irradiance used to soften preheat before sun gains."""
-        pro_flow_config = self._pro_flow_config()
-        if not bool(pro_flow_config.get(CONF_PRO_PREHEAT_ENABLED, False)):
+        settings = self._flow_settings
+        if not settings.preheat_enabled:
             return None
 
-        solar_sensor = pro_flow_config.get(CONF_PRO_PREHEAT_SOLAR_SENSOR)
+        solar_sensor = settings.preheat_solar_sensor
         if not solar_sensor:
             return None
 
@@ -584,42 +741,21 @@ class HeatPumpController:
         *,
         effective_mode: HVACMode,
         outside_temp: float | None,
-        statuses: list[dict[str, Any]],
+        target_range: tuple[float, float],
     ) -> float:
         """Return simple free-tier flow strategy based on zone targets and weather."""
-        max_target = max(float(status["target"]) for status in statuses)
-        min_target = min(float(status["target"]) for status in statuses)
+        min_target, max_target = target_range
 
         if effective_mode == HVACMode.COOL:
-            base_offset = float(
-                self._entry_config.get(
-                    CONF_COOLING_BASE_OFFSET,
-                    DEFAULT_COOLING_BASE_OFFSET,
-                )
-            )
-            slope = float(
-                self._entry_config.get(
-                    CONF_WEATHER_SLOPE_COOL,
-                    DEFAULT_WEATHER_SLOPE_COOL,
-                )
-            )
+            base_offset = self._flow_settings.cooling_base_offset
+            slope = self._flow_settings.cooling_weather_slope
             if outside_temp is not None:
                 base_offset += max(0.0, outside_temp - 24.0) * max(0.0, slope)
             flow = min_target - base_offset - self.get_flow_curve_offset()
             return max(15.0, min(25.0, flow))
 
-        base_offset = float(
-            self._entry_config.get(
-                CONF_HEATING_BASE_OFFSET,
-                DEFAULT_HEATING_BASE_OFFSET,
-            )
-        )
-        slope = float(
-            self._entry_config.get(
-                CONF_WEATHER_SLOPE_HEAT,
-                DEFAULT_WEATHER_SLOPE_HEAT,
-            )
-        )
+        base_offset = self._flow_settings.heating_base_offset
+        slope = self._flow_settings.heating_weather_slope
         if outside_temp is not None:
             base_offset += max(0.0, 15.0 - outside_temp) * max(0.0, slope)
         flow = max_target + base_offset + self.get_flow_curve_offset()
@@ -630,7 +766,7 @@ class HeatPumpController:
         *,
         effective_mode: HVACMode,
         outside_temp: float | None,
-        statuses: list[dict[str, Any]],
+        target_range: tuple[float, float],
     ) -> tuple[float, dict[str, Any]]:
         """Return (flow_temp, breakdown) for the simple strategy."""
 
@@ -638,22 +774,11 @@ class HeatPumpController:
         clamp_min = 15.0
         clamp_max = 25.0 if effective_mode == HVACMode.COOL else 35.0
 
-        max_target = max(float(status["target"]) for status in statuses)
-        min_target = min(float(status["target"]) for status in statuses)
+        min_target, max_target = target_range
 
         if effective_mode == HVACMode.COOL:
-            base_offset = float(
-                self._entry_config.get(
-                    CONF_COOLING_BASE_OFFSET,
-                    DEFAULT_COOLING_BASE_OFFSET,
-                )
-            )
-            slope = float(
-                self._entry_config.get(
-                    CONF_WEATHER_SLOPE_COOL,
-                    DEFAULT_WEATHER_SLOPE_COOL,
-                )
-            )
+            base_offset = self._flow_settings.cooling_base_offset
+            slope = self._flow_settings.cooling_weather_slope
             weather_comp = 0.0
             if outside_temp is not None:
                 weather_comp = max(0.0, outside_temp - 24.0) * max(0.0, slope)
@@ -671,24 +796,14 @@ class HeatPumpController:
                     "effective_base_offset_c": round(effective_base_offset, 3),
                     "flow_curve_offset_c": round(flow_curve_offset, 3),
                     "flow_temp_unclamped_c": round(unclamped, 3),
-                    "flow_temp_c": round(flow, 1),
+                    "flow_temp_c": round_tenth(flow),
                     "clamp_min_c": clamp_min,
                     "clamp_max_c": clamp_max,
                 },
             )
 
-        base_offset = float(
-            self._entry_config.get(
-                CONF_HEATING_BASE_OFFSET,
-                DEFAULT_HEATING_BASE_OFFSET,
-            )
-        )
-        slope = float(
-            self._entry_config.get(
-                CONF_WEATHER_SLOPE_HEAT,
-                DEFAULT_WEATHER_SLOPE_HEAT,
-            )
-        )
+        base_offset = self._flow_settings.heating_base_offset
+        slope = self._flow_settings.heating_weather_slope
         weather_comp = 0.0
         if outside_temp is not None:
             weather_comp = max(0.0, 15.0 - outside_temp) * max(0.0, slope)
@@ -704,7 +819,7 @@ class HeatPumpController:
                 "effective_base_offset_c": round(base_offset + weather_comp, 3),
                 "flow_curve_offset_c": round(flow_curve_offset, 3),
                 "flow_temp_unclamped_c": round(unclamped, 3),
-                "flow_temp_c": round(flow, 1),
+                "flow_temp_c": round_tenth(flow),
                 "clamp_min_c": clamp_min,
                 "clamp_max_c": clamp_max,
             },
@@ -714,21 +829,11 @@ class HeatPumpController:
         self,
         *,
         outside_temp: float | None,
+        now_epoch: float | None = None,
     ) -> float:
         """Return Pro flow strategy for heating with demand-weighted supervision."""
-        base_offset = float(
-            self._entry_config.get(
-                CONF_HEATING_BASE_OFFSET,
-                DEFAULT_HEATING_BASE_OFFSET,
-            )
-        )
-        weather_slope = float(
-            self._entry_config.get(
-                CONF_WEATHER_SLOPE_HEAT,
-                DEFAULT_WEATHER_SLOPE_HEAT,
-            )
-        )
-        pro_flow_config = self._pro_flow_config()
+        base_offset = self._flow_settings.heating_base_offset
+        weather_slope = self._flow_settings.heating_weather_slope
         forecast_outside_temp = self._forecast_outside_temp()
         forecast_solar_irradiance = self._forecast_solar_irradiance()
         flow = self._pro_flow_supervisor.compute_heating_flow(
@@ -739,7 +844,8 @@ class HeatPumpController:
             base_offset=base_offset,
             weather_slope=weather_slope,
             flow_curve_offset=self.get_flow_curve_offset(),
-            config=pro_flow_config,
+            config=self._pro_supervisor_config,
+            now_epoch=now_epoch,
         )
         return max(15.0, min(35.0, flow))
 
@@ -747,22 +853,12 @@ class HeatPumpController:
         self,
         *,
         outside_temp: float | None,
+        now_epoch: float | None = None,
     ) -> tuple[float, dict[str, Any]]:
         """Return (flow_temp, breakdown) for the Pro supervisor heating strategy."""
 
-        base_offset = float(
-            self._entry_config.get(
-                CONF_HEATING_BASE_OFFSET,
-                DEFAULT_HEATING_BASE_OFFSET,
-            )
-        )
-        weather_slope = float(
-            self._entry_config.get(
-                CONF_WEATHER_SLOPE_HEAT,
-                DEFAULT_WEATHER_SLOPE_HEAT,
-            )
-        )
-        pro_flow_config = self._pro_flow_config()
+        base_offset = self._flow_settings.heating_base_offset
+        weather_slope = self._flow_settings.heating_weather_slope
         forecast_outside_temp = self._forecast_outside_temp()
         forecast_solar_irradiance = self._forecast_solar_irradiance()
 
@@ -774,7 +870,8 @@ class HeatPumpController:
             base_offset=base_offset,
             weather_slope=weather_slope,
             flow_curve_offset=self.get_flow_curve_offset(),
-            config=pro_flow_config,
+            config=self._pro_supervisor_config,
+            now_epoch=now_epoch,
         )
 
         breakdown.update(
@@ -795,7 +892,11 @@ class HeatPumpController:
         return flow, breakdown
 
     def determine_flow_temperature_with_factors(
-        self, effective_mode: HVACMode, outside_temp: float | None
+        self,
+        effective_mode: HVACMode,
+        outside_temp: float | None,
+        *,
+        now_epoch: float | None = None,
     ) -> tuple[float, dict[str, Any]]:
         """Return (desired flow temperature, breakdown attributes).
 
@@ -803,7 +904,7 @@ class HeatPumpController:
         components of the computed supply temperature.
         """
 
-        statuses = self._relevant_statuses()
+        target_range = self._relevant_target_range()
         mode_value = effective_mode.value if hasattr(effective_mode, "value") else str(effective_mode)
         common: dict[str, Any] = {
             "effective_mode": str(mode_value),
@@ -811,7 +912,7 @@ class HeatPumpController:
             "outside_temp_c": None if outside_temp is None else round(float(outside_temp), 3),
         }
 
-        if not statuses:
+        if target_range is None:
             default_flow = 30.0 if effective_mode != HVACMode.COOL else 20.0
             clamp_min = 15.0
             clamp_max = 25.0 if effective_mode == HVACMode.COOL else 35.0
@@ -820,7 +921,7 @@ class HeatPumpController:
                 "target_ref_c": None,
                 "flow_curve_offset_c": round(self.get_flow_curve_offset(), 3),
                 "flow_temp_unclamped_c": round(default_flow, 3),
-                "flow_temp_c": round(default_flow, 1),
+                "flow_temp_c": round_tenth(default_flow),
                 "clamp_min_c": clamp_min,
                 "clamp_max_c": clamp_max,
             }
@@ -830,87 +931,180 @@ class HeatPumpController:
             flow, breakdown = self._determine_simple_flow_temperature_with_factors(
                 effective_mode=effective_mode,
                 outside_temp=outside_temp,
-                statuses=statuses,
+                target_range=target_range,
             )
             return flow, {**common, **breakdown}
 
         if self.flow_mode == FLOW_MODE_PRO_SUPERVISOR:
             flow, breakdown = self._determine_pro_heating_flow_temperature_with_factors(
                 outside_temp=outside_temp,
+                now_epoch=now_epoch,
             )
             return flow, {**common, **breakdown}
 
         flow, breakdown = self._determine_simple_flow_temperature_with_factors(
             effective_mode=effective_mode,
             outside_temp=outside_temp,
-            statuses=statuses,
+            target_range=target_range,
         )
         return flow, {**common, **breakdown}
 
     def determine_flow_temperature(
-        self, effective_mode: HVACMode, outside_temp: float | None
+        self,
+        effective_mode: HVACMode,
+        outside_temp: float | None,
+        *,
+        now_epoch: float | None = None,
     ) -> float:
         """Return desired flow temperature based on active strategy."""
+        if (
+            effective_mode != HVACMode.COOL
+            and self._zone_status
+            and self.flow_mode == FLOW_MODE_PRO_SUPERVISOR
+        ):
+            # Skip the breakdown attributes nobody is going to read.
+            return self._determine_pro_heating_flow_temperature(
+                outside_temp=outside_temp,
+                now_epoch=now_epoch,
+            )
+
         flow, _ = self.determine_flow_temperature_with_factors(
             effective_mode,
             outside_temp,
+            now_epoch=now_epoch,
         )
         return flow
 
     def register_thermostat(self, thermostat: ThermozonaThermostat) -> None:
         """Register a thermostat for notifications."""
         self._thermostats.add(thermostat)
-        if (
-            getattr(thermostat, "control_mode", None) == CONTROL_MODE_PWM
-            and thermostat not in self._pwm_zone_indices
-        ):
-            self._pwm_zone_indices[thermostat] = self._next_pwm_zone_index
-            self._next_pwm_zone_index += 1
-        self._hass.async_create_task(thermostat.async_update_mode_listener())
+        if getattr(thermostat, "control_mode", None) == CONTROL_MODE_PWM:
+            if thermostat not in self._pwm_zone_indices:
+                self._pwm_zone_indices[thermostat] = self._next_pwm_zone_index
+                self._next_pwm_zone_index += 1
+            self._push_pwm_zone_info()
+        self._update_mode_listener()
+        if self._remove_circuit_listener is None:
+            self._subscribe_circuits()
 
     def unregister_thermostat(self, thermostat: ThermozonaThermostat) -> None:
         """Unregister a thermostat."""
         self._thermostats.discard(thermostat)
+        if thermostat in self._pwm_zone_indices:
+            self._push_pwm_zone_info()
+        if not self._thermostats:
+            self._update_mode_listener()
+            self._unsubscribe_circuits()
+
+    def _subscribe_circuits(self) -> None:
+        """Track which circuits are on so demand checks need no state scan."""
+        self._unsubscribe_circuits()
+        circuits = self.get_all_circuit_entities()
+        states = self._hass.states
+        self._active_circuits.update(
+            entity_id
+            for entity_id in circuits
+            if (state := states.get(entity_id)) is not None and state.state == "on"
+        )
+        self._remove_circuit_listener = async_track_state_change_event(
+            self._hass,
+            list(circuits),
+            self._handle_circuit_state_change,
+        )
 
-    def get_pwm_zone_info(self, thermostat: ThermozonaThermostat) -> tuple[int, int]:
-        """Return deterministic PWM staggering index and active PWM zone count."""
-        if getattr(thermostat, "control_mode", None) != CONTROL_MODE_PWM:
-            return (0, 0)
+    def _unsubscribe_circuits(self) -> None:
+        """Stop tracking circuit states."""
+        if self._remove_circuit_listener is not None:
+            self._remove_circuit_listener()
+            self._remove_circuit_listener = None
+        self._active_circuits.clear()
+
+    @callback
+    def _handle_circuit_state_change(self, event) -> None:
+        """Keep the active-circuit set in step with circuit state changes."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        if new_state is not None and new_state.state == "on":
+            self._active_circuits.add(entity_id)
+        else:
+            self._active_circuits.discard(entity_id)
 
-        zone_index = self._pwm_zone_indices.get(thermostat)
-        if zone_index is None:
-            return (0, 0)
+    def _update_mode_listener(self) -> None:
+        """Keep one subscription on the heat pump mode entity for all zones."""
+        mode_entity = self.mode_entity if self._thermostats else None
+        if self._mode_listener_entity == mode_entity:
+            return
 
-        zone_count = sum(
-            1
-            for entity in self._thermostats
-            if getattr(entity, "control_mode", None) == CONTROL_MODE_PWM
-            and entity in self._pwm_zone_indices
-        )
-        return (zone_index, zone_count)
+        if self._remove_mode_listener is not None:
+            self._remove_mode_listener()
+            self._remove_mode_listener = None
+
+        self._mode_listener_entity = mode_entity
+
+        if mode_entity is not None:
+            self._remove_mode_listener = async_track_state_change_event(
+                self._hass,
+                mode_entity,
+                self._handle_mode_entity_change,
+            )
+
+    async def _handle_mode_entity_change(self, _event) -> None:
+        """Fan a heat pump mode change out to every registered thermostat."""
+        self._notify_thermostats()
+
+    def _push_pwm_zone_info(self) -> None:
+        """Hand every registered PWM zone its stagger index and the zone count."""
+        members = [
+            thermostat
+            for thermostat in self._thermostats
+            if thermostat in self._pwm_zone_indices
+        ]
+        zone_count = len(members)
+        for thermostat in members:
+            thermostat.set_pwm_zone_info(
+                self._pwm_zone_indices[thermostat], zone_count
+            )
 
     def _notify_thermostats(
         self, *, skip: ThermozonaThermostat | None = None
     ) -> None:
         """Ask all thermostats (except the source) to re-evaluate control."""
-        for thermostat in list(self._thermostats):
+        # Scheduling never touches the registry, and WeakSet iteration already
+        # defers removals of collected entries, so no snapshot copy is needed.
+        for thermostat in self._thermostats:
             if thermostat is skip:
                 continue
             thermostat.async_schedule_control()
 
     async def async_update_heat_pump_state(self) -> None:
-        """Update the heat pump switch and flow temperature based on circuit state."""
-        try:
-            circuits = self.get_all_circuit_entities()
-            _LOGGER.debug("%s: Checking circuits for heat pump control: %s", DOMAIN, circuits)
+        """Update the heat pump switch and flow temperature based on circuit state.
 
-            any_circuit_on = False
-            for entity_id in circuits:
-                state = self._hass.states.get(entity_id)
-                if state and state.state == "on":
-                    any_circuit_on = True
-                    _LOGGER.debug("%s: Circuit %s is active", DOMAIN, entity_id)
-                    break
+        Requests arriving while an update runs are folded into one follow-up
+        update; every caller returns once the state reflects its request.
+        """
+        self._pump_update_dirty = True
+        task = self._pump_update_task
+        if task is None or task.done():
+            task = self._pump_update_task = self._hass.async_create_task(
+                self._async_drain_pump_updates()
+            )
+        # Shielded so a cancelled caller does not abort the shared update.
+        await asyncio.shield(task)
+
+    async def _async_drain_pump_updates(self) -> None:
+        """Run heat pump updates until no new request arrived in the meantime."""
+        while self._pump_update_dirty:
+            self._pump_update_dirty = False
+            await self._async_refresh_heat_pump_state()
+
+    async def _async_refresh_heat_pump_state(self) -> None:
+        """Evaluate circuit demand once and push pump status and flow target."""
+        try:
+            if self._remove_circuit_listener is not None:
+                # Circuit states are tracked by the listener while zones run.
+                any_circuit_on = bool(self._active_circuits)
+            else:
+                any_circuit_on = self._scan_circuits_for_demand()
 
             now = datetime.now(timezone.utc)
 
@@ -932,6 +1126,20 @@ class HeatPumpController:
         except Exception as exc:  # pragma: no cover - defensive logging
             _LOGGER.error("%s: Error updating heat pump state: %s", DOMAIN, exc)
 
+    def _scan_circuits_for_demand(self) -> bool:
+        """Return True if any configured circuit is currently on."""
+        circuits = self.get_all_circuit_entities()
+        _LOGGER.debug(
+            "%s: Checking circuits for heat pump control: %s", DOMAIN, circuits
+        )
+
+        for entity_id in circuits:
+            state = self._hass.states.get(entity_id)
+            if state and state.state == "on":
+                _LOGGER.debug("%s: Circuit %s is active", DOMAIN, entity_id)
+                return True
+        return False
+
     async def _async_set_flow_temperature(self) -> HVACMode | None:
         """Calculate and set the flow temperature using the weather-compensation curve."""
         outside_sensor = self._outside_temp_sensor()
@@ -970,10 +1178,22 @@ class HeatPumpController:
         else:
             effective_mode = self.determine_auto_mode()
 
-        flow_temp, flow_factors = self.determine_flow_temperature_with_factors(
-            effective_mode,
-            outside_temp,
-        )
+        # One clock read per tick, shared by the supervisor and write policy.
+        now = datetime.now(timezone.utc)
+        now_epoch = now.timestamp()
+        sensor_entity = self._flow_temp_sensor()
+        if sensor_entity is not None:
+            flow_temp, flow_factors = self.determine_flow_temperature_with_factors(
+                effective_mode,
+                outside_temp,
+                now_epoch=now_epoch,
+            )
+        else:
+            # Breakdown attributes are only surfaced by the flow sensor.
+            flow_temp = self.determine_flow_temperature(
+                effective_mode, outside_temp, now_epoch=now_epoch
+            )
+            flow_factors = {}
 
         _LOGGER.debug(
             "%s: Setting flow temperature to %.1f°C (mode=%s, outside=%s)",
@@ -984,10 +1204,10 @@ class HeatPumpController:
         )
 
         self._last_flow_temp = flow_temp
-        self._last_flow_factors = flow_factors
-        now = datetime.now(timezone.utc)
+        if flow_factors != self._last_flow_factors:
+            self._last_flow_factors = flow_factors
 
-        if (sensor_entity := self._flow_temp_sensor()) is not None:
+        if sensor_entity is not None:
             sensor_entity.set_calculated_value(flow_temp)
 
         if not self._should_dispatch_flow_temperature(flow_temp=flow_temp, now=now):
@@ -1015,17 +1235,3 @@ class HeatPumpController:
             self._last_flow_write_time = now
         return effective_mode
 
-    def refresh_entry_config(self, entry_config: dict[str, Any]) -> None:
-        """Update internal reference to the config entry (for reload scenarios)."""
-        self._entry_config = entry_config
-        license_result = validate_pro_license_key(self._pro_license_key())
-        self._pro_enabled = license_result.is_valid
-        self._apply_license_state(
-            self._pro_license_key(),
-            license_result,
-            entry_config.get(CONF_FLOW_MODE),
-        )
-        self._pro_flow_supervisor.reset()
-        self._last_flow_write_temp = None
-        self._last_flow_write_time = None
-        self.reset_flow_curve_offset()
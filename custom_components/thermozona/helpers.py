@@ -1,9 +1,10 @@
 """Helper utilities for the Thermozona integration."""
 from __future__ import annotations
 
+from math import floor
 from typing import Any
 
-from . import CONF_CIRCUITS
+from . import CONF_CIRCUITS, DOMAIN
 
 
 def resolve_circuits(zone_config: dict[str, Any]) -> list[str]:
@@ -12,3 +13,18 @@ def resolve_circuits(zone_config: dict[str, Any]) -> list[str]:
     if circuits is None:
         circuits = zone_config.get("groups")
     return circuits or []
+
+
+def device_info_for(entry_id: str) -> dict[str, Any]:
+    """Return a fresh device info dict for an entity of the config entry."""
+    return {
+        "identifiers": {(DOMAIN, entry_id)},
+        "name": "Thermozona",
+    }
+
+
+def round_tenth(value: float) -> float:
+    """Return value rounded to one decimal (half away from zero)."""
+    if value >= 0:
+        return floor(value * 10.0 + 0.5) / 10.0
+    return -floor(-value * 10.0 + 0.5) / 10.0
@@ -1,19 +1,26 @@
 """License utilities for Thermozona tier gating."""
 from __future__ import annotations
 
-import base64
+import binascii
+import hashlib
 import json
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
-PRO_LICENSE_ISSUERS = {"thermozona", "thermozona.appventures.nl"}
-PRO_LICENSE_SOURCES = {"github_sponsors", "ghs"}
-PRO_LICENSE_TIERS = {"pro", "sponsor"}
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+PRO_LICENSE_ISSUERS = frozenset({"thermozona", "thermozona.appventures.nl"})
+PRO_LICENSE_SOURCES = frozenset({"github_sponsors", "ghs"})
+PRO_LICENSE_TIERS = frozenset({"pro", "sponsor"})
 
 PRO_LICENSE_DEFAULT_KEY_ID = "main-2026-01"
 
@@ -25,8 +32,19 @@ MCowBQYDK2VwAyEALt8+/pQOfUQRN3Sugun636DwGzabBdPCJ/D82Q8/oiI=
 PRO_LICENSE_PUBLIC_KEY_PEM_ENV = "THERMOZONA_LICENSE_PUBLIC_KEY_PEM"
 PRO_LICENSE_PUBLIC_KEYS_JSON_ENV = "THERMOZONA_LICENSE_PUBLIC_KEYS_JSON"
 
+# Padding needed to complete a base64url segment, indexed by ``len(segment) & 3``.
+_B64_PAD = (b"", b"===", b"==", b"=")
+_B64URL_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+
+_VALIDATION_CACHE_SIZE = 32
+
+_MAX_TOKEN_LENGTH = 4096
+_JWT_ALLOWED_CHARS = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_."
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True, eq=False)
 class LicenseValidationResult:
     """Structured result of Pro license validation."""
 
@@ -34,6 +52,19 @@ class LicenseValidationResult:
     reason: str
 
 
+_RESULT_OK = LicenseValidationResult(True, "ok")
+_INVALID_RESULTS: dict[str, LicenseValidationResult] = {}
+
+# Successful validations keyed by token/keyring digest, mapped to (exp, result).
+_VALIDATION_CACHE: OrderedDict[bytes, tuple[int, LicenseValidationResult]] = (
+    OrderedDict()
+)
+# Last parsed keyring as ((keys JSON env, PEM env), keys).
+_KEYRING_CACHE: (
+    tuple[tuple[str | None, str | None], dict[str, Ed25519PublicKey] | None] | None
+) = None
+
+
 def normalize_license_key(license_key: str | None) -> str:
     """Return normalized license key representation for validation."""
     if license_key is None:
@@ -49,88 +80,147 @@ def is_pro_license_key(license_key: str | None) -> bool:
     return validate_pro_license_key(license_key).is_valid
 
 
-def is_github_sponsor_token(license_key: str | None) -> bool:
-    """Backward-compatible alias for Pro license validation."""
-    return validate_pro_license_key(license_key).is_valid
+# Backward-compatible alias for Pro license validation.
+is_github_sponsor_token = is_pro_license_key
 
 
 def validate_pro_license_key(license_key: str | None) -> LicenseValidationResult:
     """Validate a Pro license JWT with signature and claim checks."""
     normalized = normalize_license_key(license_key)
     if not normalized:
-        return LicenseValidationResult(False, "missing_token")
+        return _invalid("missing_token")
+
+    if not _is_structurally_valid_jwt(normalized):
+        return _invalid("malformed_token")
+
+    cache_key = _validation_cache_key(normalized)
+    cached = _VALIDATION_CACHE.get(cache_key)
+    if cached is not None:
+        exp, result = cached
+        if exp > int(time.time()):
+            _VALIDATION_CACHE.move_to_end(cache_key)
+            return result
+        del _VALIDATION_CACHE[cache_key]
 
     decoded = _decode_jwt(normalized)
     if decoded is None:
-        return LicenseValidationResult(False, "malformed_token")
+        return _invalid("malformed_token")
 
     header, payload, signing_input, signature = decoded
 
     if header.get("alg") != "EdDSA":
-        return LicenseValidationResult(False, "unsupported_alg")
+        return _invalid("unsupported_alg")
 
     key_id = header.get("kid")
     if key_id is not None and (not isinstance(key_id, str) or not key_id.strip()):
-        return LicenseValidationResult(False, "invalid_kid")
+        return _invalid("invalid_kid")
 
+    issuer = payload.get("iss")
+    subject = payload.get("sub")
+    source = payload.get("src")
+    tier = payload.get("tier")
+
+    if not isinstance(issuer, str) or issuer not in PRO_LICENSE_ISSUERS:
+        return _invalid("invalid_issuer")
+    if not isinstance(subject, str) or not subject.strip():
+        return _invalid("invalid_subject")
+    if not isinstance(source, str) or source not in PRO_LICENSE_SOURCES:
+        return _invalid("invalid_source")
+    if not isinstance(tier, str) or tier not in PRO_LICENSE_TIERS:
+        return _invalid("invalid_tier")
+
+    time_window_reason = _validate_payload_time_window(payload)
+    if time_window_reason is not None:
+        return _invalid(time_window_reason)
+
+    # Signature verification is the expensive step; run it only once every
+    # cheap header and claim check has passed.
     public_keys = _load_public_keys()
     if public_keys is None:
-        return LicenseValidationResult(False, "public_key_load_failed")
+        return _invalid("public_key_load_failed")
 
     if isinstance(key_id, str):
         public_key = public_keys.get(key_id)
         if public_key is None:
-            return LicenseValidationResult(False, "unknown_kid")
+            return _invalid("unknown_kid")
     else:
         public_key = public_keys.get(PRO_LICENSE_DEFAULT_KEY_ID)
         if public_key is None and len(public_keys) == 1:
             public_key = next(iter(public_keys.values()))
         if public_key is None:
-            return LicenseValidationResult(False, "unknown_kid")
+            return _invalid("unknown_kid")
+
+    if not _verify_signature(public_key, signature, signing_input):
+        return _invalid("invalid_signature")
+
+    _VALIDATION_CACHE[cache_key] = (payload["exp"], _RESULT_OK)
+    if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+    return _RESULT_OK
+
+
+def _invalid(reason: str) -> LicenseValidationResult:
+    """Return the shared invalid result for a rejection reason."""
+    result = _INVALID_RESULTS.get(reason)
+    if result is None:
+        result = _INVALID_RESULTS[reason] = LicenseValidationResult(False, reason)
+    return result
+
+
+def _verify_signature(
+    public_key: Ed25519PublicKey, signature: bytes, signing_input: bytes
+) -> bool:
+    """Verify an Ed25519 signature."""
+    # cryptography is imported lazily so free-tier setups never load OpenSSL.
+    from cryptography.exceptions import InvalidSignature
 
     try:
         public_key.verify(signature, signing_input)
     except InvalidSignature:
-        return LicenseValidationResult(False, "invalid_signature")
+        return False
+    return True
 
-    issuer = payload.get("iss")
-    subject = payload.get("sub")
-    source = payload.get("src")
-    tier = payload.get("tier")
 
-    if issuer not in PRO_LICENSE_ISSUERS:
-        return LicenseValidationResult(False, "invalid_issuer")
-    if not isinstance(subject, str) or not subject.strip():
-        return LicenseValidationResult(False, "invalid_subject")
-    if source not in PRO_LICENSE_SOURCES:
-        return LicenseValidationResult(False, "invalid_source")
-    if tier not in PRO_LICENSE_TIERS:
-        return LicenseValidationResult(False, "invalid_tier")
+def _validation_cache_key(normalized: str) -> bytes:
+    """Return a digest of the token and the active keyring configuration."""
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16)
+    for env_name in (PRO_LICENSE_PUBLIC_KEYS_JSON_ENV, PRO_LICENSE_PUBLIC_KEY_PEM_ENV):
+        digest.update(b"\0")
+        digest.update((os.getenv(env_name) or "").encode("utf-8"))
+    return digest.digest()
 
-    time_window_reason = _validate_payload_time_window(payload)
-    if time_window_reason is not None:
-        return LicenseValidationResult(False, time_window_reason)
 
-    return LicenseValidationResult(True, "ok")
+def _is_structurally_valid_jwt(token: str) -> bool:
+    """Cheaply reject tokens that cannot be a compact JWS before decoding."""
+    if len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        return False
+    if not token.isascii():
+        return False
+    return not token.encode("ascii").translate(None, _JWT_ALLOWED_CHARS)
 
 
 def _decode_jwt(token: str) -> tuple[dict, dict, bytes, bytes] | None:
     """Decode a JWT into header/payload/signature parts."""
-    parts = token.split(".")
+    try:
+        token_bytes = token.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+    parts = token_bytes.translate(_B64URL_TO_STANDARD).split(b".")
     if len(parts) != 3:
         return None
 
     try:
-        raw_header = _decode_base64url(parts[0])
-        raw_payload = _decode_base64url(parts[1])
-        signature = _decode_base64url(parts[2])
+        raw_header, raw_payload, signature = (
+            binascii.a2b_base64(part + _B64_PAD[len(part) & 3]) for part in parts
+        )
     except ValueError:
         return None
 
     try:
-        header = json.loads(raw_header.decode("utf-8"))
-        payload = json.loads(raw_payload.decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError):
+        header = _json_loads(raw_header)
+        payload = _json_loads(raw_payload)
+    except ValueError:
         return None
 
     if not isinstance(header, dict):
@@ -138,22 +228,31 @@ def _decode_jwt(token: str) -> tuple[dict, dict, bytes, bytes] | None:
     if not isinstance(payload, dict):
         return None
 
-    signing_input = f"{parts[0]}.{parts[1]}".encode("ascii")
+    signing_input = token_bytes[: token_bytes.rindex(b".")]
     return header, payload, signing_input, signature
 
 
-def _decode_base64url(value: str) -> bytes:
-    """Decode a base64url segment."""
-    padded = value + "=" * ((4 - len(value) % 4) % 4)
-    try:
-        return base64.urlsafe_b64decode(padded.encode("ascii"))
-    except (ValueError, UnicodeEncodeError) as err:
-        raise ValueError("invalid base64url") from err
-
-
 def _load_public_keys() -> dict[str, Ed25519PublicKey] | None:
-    """Load configured keyring used for Pro license verification."""
-    json_keys = os.getenv(PRO_LICENSE_PUBLIC_KEYS_JSON_ENV)
+    """Return the configured keyring, parsed once per key configuration."""
+    global _KEYRING_CACHE
+
+    env_values = (
+        os.getenv(PRO_LICENSE_PUBLIC_KEYS_JSON_ENV),
+        os.getenv(PRO_LICENSE_PUBLIC_KEY_PEM_ENV),
+    )
+    cached = _KEYRING_CACHE
+    if cached is not None and cached[0] == env_values:
+        return cached[1]
+
+    keys = _parse_public_keys(*env_values)
+    _KEYRING_CACHE = (env_values, keys)
+    return keys
+
+
+def _parse_public_keys(
+    json_keys: str | None, public_pem: str | None
+) -> dict[str, Ed25519PublicKey] | None:
+    """Parse the keyring used for Pro license verification."""
     if json_keys:
         try:
             parsed = json.loads(json_keys)
@@ -178,7 +277,8 @@ def _load_public_keys() -> dict[str, Ed25519PublicKey] | None:
             return None
         return keys
 
-    public_pem = os.getenv(PRO_LICENSE_PUBLIC_KEY_PEM_ENV, PRO_LICENSE_PUBLIC_KEY_PEM)
+    if public_pem is None:
+        public_pem = PRO_LICENSE_PUBLIC_KEY_PEM
     public_key = _load_single_public_key(public_pem)
     if public_key is None:
         return None
@@ -187,6 +287,9 @@ def _load_public_keys() -> dict[str, Ed25519PublicKey] | None:
 
 def _load_single_public_key(public_pem: str) -> Ed25519PublicKey | None:
     """Load one PEM public key as Ed25519."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
     try:
         key = serialization.load_pem_public_key(public_pem.encode("utf-8"))
     except (TypeError, ValueError):
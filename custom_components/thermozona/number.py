@@ -10,8 +10,8 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import DOMAIN
 from .heat_pump import HeatPumpController
+from .helpers import device_info_for, round_tenth
 from .pro.number import ThermozonaFlowCurveOffsetNumber
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,16 +23,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Thermozona number entities."""
-    domain_data = hass.data[DOMAIN]
-    entry_config = domain_data[config_entry.entry_id]
-
-    controllers = domain_data.setdefault("controllers", {})
-    controller = controllers.get(config_entry.entry_id)
-    if controller is None:
-        controller = HeatPumpController(hass, entry_config)
-    else:
-        controller.refresh_entry_config(entry_config)
-    controllers[config_entry.entry_id] = controller
+    controller: HeatPumpController = config_entry.runtime_data
 
     entities: list[NumberEntity] = [
         ThermozonaFlowTemperatureNumber(config_entry.entry_id, controller),
@@ -65,10 +56,7 @@ class ThermozonaFlowTemperatureNumber(NumberEntity):
     ) -> None:
         self._controller = controller
         self._attr_unique_id = f"{entry_id}_flow_temperature"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Thermozona",
-        }
+        self._attr_device_info = device_info_for(entry_id)
         self._attr_native_value: float | None = None
 
     async def async_added_to_hass(self) -> None:
@@ -89,5 +77,5 @@ class ThermozonaFlowTemperatureNumber(NumberEntity):
 
     def set_calculated_value(self, value: float) -> None:
         """Update the number with the latest calculated flow temperature."""
-        self._attr_native_value = round(value, 1)
+        self._attr_native_value = round_tenth(value)
         self.async_write_ha_state()
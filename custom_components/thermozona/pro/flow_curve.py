@@ -3,7 +3,6 @@
 """Sponsor-required runtime flow-curve offset manager."""
 from __future__ import annotations
 
-import weakref
 from typing import Callable, Protocol
 
 
@@ -17,6 +16,14 @@ class FlowCurveOffsetEntity(Protocol):
 class FlowCurveRuntimeManager:
     """Manage runtime flow-curve override and helper entity sync."""
 
+    __slots__ = (
+        "_get_yaml_value",
+        "_notify_thermostats",
+        "_override",
+        "_effective",
+        "_entity",
+    )
+
     def __init__(
         self,
         *,
@@ -26,42 +33,37 @@ class FlowCurveRuntimeManager:
         self._get_yaml_value = get_yaml_value
         self._notify_thermostats = notify_thermostats
         self._override: float | None = None
-        self._entity: weakref.ReferenceType[FlowCurveOffsetEntity] | None = None
+        self._effective = get_yaml_value()
+        self._entity: FlowCurveOffsetEntity | None = None
 
     def register_entity(self, entity: FlowCurveOffsetEntity) -> None:
-        """Register helper number entity."""
-        self._entity = weakref.ref(entity)
-        entity.set_current_value(self.get_value())
+        """Register helper number entity; the entity pushes its own first state."""
+        self._entity = entity
 
     def unregister_entity(self, entity: FlowCurveOffsetEntity) -> None:
         """Unregister helper number entity."""
-        if self._entity is not None and self._entity() is entity:
+        if self._entity is entity:
             self._entity = None
 
     def get_value(self) -> float:
         """Return active flow-curve offset value."""
-        if self._override is not None:
-            return self._override
-        return self._get_yaml_value()
+        return self._effective
 
     def set_override(self, value: float) -> None:
         """Set runtime override and notify listeners."""
         self._override = float(value)
+        self._effective = self._override
         self._write_entity_state()
         self._notify_thermostats()
 
     def reset_override(self) -> None:
         """Clear runtime override and notify listeners."""
         self._override = None
+        self._effective = self._get_yaml_value()
         self._write_entity_state()
         self._notify_thermostats()
 
     def _write_entity_state(self) -> None:
         """Sync active value to helper entity, when available."""
-        if self._entity is None:
-            return
-        entity = self._entity()
-        if entity is None:
-            self._entity = None
-            return
-        entity.set_current_value(self.get_value())
+        if self._entity is not None:
+            self._entity.set_current_value(self._effective)
@@ -4,10 +4,28 @@
 from __future__ import annotations
 
 import math
-from datetime import datetime, timezone
-from typing import Any, NamedTuple
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from .. import ZONE_RESPONSE_FAST, ZONE_RESPONSE_SLOW
+from ..helpers import round_tenth
+
+if TYPE_CHECKING:
+    from ..heat_pump import ZoneStatus
+
+
+def _clamp(value: float, minimum: float, maximum: float) -> float:
+    """Clamp ``value`` to the inclusive ``[minimum, maximum]`` range."""
+    return minimum if value < minimum else (maximum if value > maximum else value)
+
+
+def _norm_pair(first: Any, second: Any) -> tuple[float, float]:
+    """Return two non-negative weights scaled to sum to 1, or (1, 0) if both are 0."""
+    first_value = max(0.0, float(first))
+    second_value = max(0.0, float(second))
+    total = first_value + second_value
+    if total <= 0:
+        return 1.0, 0.0
+    return first_value / total, second_value / total
 
 
 class _ZoneDemand(NamedTuple):
@@ -17,42 +35,144 @@ class _ZoneDemand(NamedTuple):
     target: float
     error: float
     duty: float
-    response: str
+    is_fast: bool
     weight: float
     solar_weight: float
     score: float
 
 
+class _FlowTerms(NamedTuple):
+    """Raw supervisor terms behind a single flow evaluation."""
+
+    target_ref: float
+    di_slow: float
+    di_fast: float
+    demand_index: float
+    weather_term: float
+    trim_p: float
+    integral: float
+    fast_boost: float
+    preheat_boost: float
+    raw_flow: float
+    smoothed_flow: float
+
+
+_NO_DEMAND_BREAKDOWN: dict[str, Any] = {
+    "target_ref_c": None,
+    "di_slow": 0.0,
+    "di_fast": 0.0,
+    "slow_mix_weight": 0.0,
+    "fast_mix_weight": 0.0,
+    "demand_index": 0.0,
+    "kp": 0.0,
+    "trim_p_c": 0.0,
+    "integral_enabled": False,
+    "integral_c": 0.0,
+    "fast_boost_c": 0.0,
+    "preheat_boost_c": 0.0,
+    "flow_temp_unclamped_c": 30.0,
+    "flow_temp_smoothed_c": 30.0,
+    "flow_temp_c": 30.0,
+    "clamp_min_c": 15.0,
+    "clamp_max_c": 35.0,
+}
+
+
+class SupervisorConfig(NamedTuple):
+    """Normalized Pro supervisor tuning, parsed once per config change."""
+
+    error_norm_max: float
+    duty_ema_minutes: float
+    error_weight: float
+    duty_weight: float
+    slow_mix: float
+    fast_mix: float
+    kp: float
+    use_integral: bool
+    ti_minutes: float
+    i_max: float
+    fast_error_deadband: float
+    fast_boost_gain: float
+    fast_boost_cap: float
+    preheat_enabled: bool
+    preheat_gain: float
+    preheat_solar_gain_per_w_m2: float
+    preheat_cap: float
+    preheat_min_slow_di: float
+    slew_up_per_5m: float
+    slew_down_per_5m: float
+
+
 class ProFlowSupervisor:
     """Compute a stable, demand-weighted heating flow setpoint."""
 
     def __init__(self) -> None:
         self._ema_duty: dict[str, float] = {}
         self._integral = 0.0
-        self._last_eval_time: datetime | None = None
+        self._last_eval_epoch: float | None = None
         self._last_flow = 30.0
 
     def reset(self) -> None:
         """Reset adaptive state after reload/reconfiguration."""
         self._ema_duty.clear()
         self._integral = 0.0
-        self._last_eval_time = None
+        self._last_eval_epoch = None
         self._last_flow = 30.0
 
+    @classmethod
+    def prepare_config(cls, config: dict[str, Any]) -> SupervisorConfig:
+        """Parse raw Pro flow config into clamped, pre-normalized tuning values."""
+        error_weight, duty_weight = _norm_pair(
+            config.get("error_weight", 0.6), config.get("duty_weight", 0.4)
+        )
+        slow_mix, fast_mix = _norm_pair(
+            config.get("slow_mix_weight", 0.8), config.get("fast_mix_weight", 0.2)
+        )
+
+        return SupervisorConfig(
+            error_norm_max=max(0.1, float(config.get("error_norm_max", 2.0))),
+            duty_ema_minutes=max(1.0, float(config.get("duty_ema_minutes", 20))),
+            error_weight=error_weight,
+            duty_weight=duty_weight,
+            slow_mix=slow_mix,
+            fast_mix=fast_mix,
+            kp=max(0.0, float(config.get("kp", 1.0))),
+            use_integral=bool(config.get("use_integral", False)),
+            ti_minutes=max(1.0, float(config.get("ti_minutes", 180))),
+            i_max=max(0.0, float(config.get("i_max", 1.5))),
+            fast_error_deadband=max(
+                0.0, float(config.get("fast_error_deadband_c", 0.4))
+            ),
+            fast_boost_gain=max(0.0, float(config.get("fast_boost_gain", 1.2))),
+            fast_boost_cap=max(0.0, float(config.get("fast_boost_cap_c", 1.2))),
+            preheat_enabled=bool(config.get("preheat_enabled", False)),
+            preheat_gain=max(0.0, float(config.get("preheat_gain", 0.35))),
+            preheat_solar_gain_per_w_m2=max(
+                0.0, float(config.get("preheat_solar_gain_per_w_m2", 0.0))
+            ),
+            preheat_cap=max(0.0, float(config.get("preheat_cap_c", 1.2))),
+            preheat_min_slow_di=max(
+                0.0, float(config.get("preheat_min_slow_di", 0.25))
+            ),
+            slew_up_per_5m=max(0.0, float(config.get("slew_up_c_per_5m", 0.3))),
+            slew_down_per_5m=max(0.0, float(config.get("slew_down_c_per_5m", 0.2))),
+        )
+
     def compute_heating_flow(
         self,
         *,
-        zone_status: dict[str, dict[str, Any]],
+        zone_status: dict[str, ZoneStatus],
         outside_temp: float | None,
         forecast_outside_temp: float | None,
         forecast_solar_irradiance: float | None,
         base_offset: float,
         weather_slope: float,
         flow_curve_offset: float,
-        config: dict[str, Any],
+        config: SupervisorConfig,
+        now_epoch: float | None = None,
     ) -> float:
         """Return supervised heating flow command in degrees Celsius."""
-        flow, _ = self.compute_heating_flow_with_breakdown(
+        flow, _ = self._compute_heating_flow_core(
             zone_status=zone_status,
             outside_temp=outside_temp,
             forecast_outside_temp=forecast_outside_temp,
@@ -61,193 +181,223 @@ class ProFlowSupervisor:
             weather_slope=weather_slope,
             flow_curve_offset=flow_curve_offset,
             config=config,
+            now_epoch=now_epoch,
         )
         return flow
 
     def compute_heating_flow_with_breakdown(
         self,
         *,
-        zone_status: dict[str, dict[str, Any]],
+        zone_status: dict[str, ZoneStatus],
         outside_temp: float | None,
         forecast_outside_temp: float | None,
         forecast_solar_irradiance: float | None,
         base_offset: float,
         weather_slope: float,
         flow_curve_offset: float,
-        config: dict[str, Any],
+        config: SupervisorConfig,
+        now_epoch: float | None = None,
     ) -> tuple[float, dict[str, Any]]:
         """Return (flow, breakdown) for observability attributes."""
-        now = datetime.now(timezone.utc)
+        flow, terms = self._compute_heating_flow_core(
+            zone_status=zone_status,
+            outside_temp=outside_temp,
+            forecast_outside_temp=forecast_outside_temp,
+            forecast_solar_irradiance=forecast_solar_irradiance,
+            base_offset=base_offset,
+            weather_slope=weather_slope,
+            flow_curve_offset=flow_curve_offset,
+            config=config,
+            now_epoch=now_epoch,
+        )
+        if terms is None:
+            return flow, dict(_NO_DEMAND_BREAKDOWN)
+
+        # Terms are plain floats from the core pass, so only rounding is needed.
+        use_integral = config.use_integral
+        breakdown = {
+            "target_ref_c": round(terms.target_ref, 3),
+            "di_slow": round(terms.di_slow, 6),
+            "di_fast": round(terms.di_fast, 6),
+            "slow_mix_weight": round(config.slow_mix, 6),
+            "fast_mix_weight": round(config.fast_mix, 6),
+            "demand_index": round(terms.demand_index, 6),
+            "weather_term_c": round(terms.weather_term, 3),
+            "kp": round(config.kp, 6),
+            "trim_p_c": round(terms.trim_p, 3),
+            "integral_enabled": use_integral,
+            "integral_c": round(terms.integral if use_integral else 0.0, 6),
+            "fast_boost_c": round(terms.fast_boost, 3),
+            "preheat_boost_c": round(terms.preheat_boost, 3),
+            "flow_temp_unclamped_c": round(terms.raw_flow, 3),
+            "flow_temp_smoothed_c": round(terms.smoothed_flow, 3),
+            "flow_temp_c": round_tenth(flow),
+            "clamp_min_c": 15.0,
+            "clamp_max_c": 35.0,
+        }
+        return flow, breakdown
+
+    def _compute_heating_flow_core(
+        self,
+        *,
+        zone_status: dict[str, ZoneStatus],
+        outside_temp: float | None,
+        forecast_outside_temp: float | None,
+        forecast_solar_irradiance: float | None,
+        base_offset: float,
+        weather_slope: float,
+        flow_curve_offset: float,
+        config: SupervisorConfig,
+        now_epoch: float | None = None,
+    ) -> tuple[float, _FlowTerms | None]:
+        """Return the clamped flow and its raw terms (None without demand)."""
+        now = time.time() if now_epoch is None else now_epoch
         dt_minutes = self._get_dt_minutes(now)
 
         demand_entries = self._build_zone_demands(zone_status, dt_minutes, config)
         if not demand_entries:
-            self._last_eval_time = now
-            breakdown = {
-                "target_ref_c": None,
-                "di_slow": 0.0,
-                "di_fast": 0.0,
-                "slow_mix_weight": 0.0,
-                "fast_mix_weight": 0.0,
-                "demand_index": 0.0,
-                "kp": 0.0,
-                "trim_p_c": 0.0,
-                "integral_enabled": False,
-                "integral_c": 0.0,
-                "fast_boost_c": 0.0,
-                "preheat_boost_c": 0.0,
-                "flow_temp_unclamped_c": 30.0,
-                "flow_temp_smoothed_c": 30.0,
-                "flow_temp_c": 30.0,
-                "clamp_min_c": 15.0,
-                "clamp_max_c": 35.0,
-            }
-            return 30.0, breakdown
-
-        slow_entries = [
-            entry for entry in demand_entries if entry.response == ZONE_RESPONSE_SLOW
-        ]
-        fast_entries = [
-            entry for entry in demand_entries if entry.response == ZONE_RESPONSE_FAST
-        ]
+            self._last_eval_epoch = now
+            return 30.0, None
+
+        # Fast zones are only counted; the slow list is kept for preheat.
+        slow_entries: list[_ZoneDemand] = []
+        fast_count = 0
+        slow_target = fast_target = float("-inf")
+        slow_weighted_sum = slow_weight = fast_weighted_sum = fast_weight = 0.0
+        fast_error_deadband = config.fast_error_deadband
+        max_fast_excess = 0.0
+        for entry in demand_entries:
+            weight = entry.weight
+            if entry.is_fast:
+                fast_count += 1
+                if entry.target > fast_target:
+                    fast_target = entry.target
+                if weight > 0:
+                    fast_weighted_sum += entry.score * weight
+                    fast_weight += weight
+                excess_error = entry.error - fast_error_deadband
+                if excess_error > 0.0:
+                    excess = excess_error * entry.duty * weight
+                    if excess > max_fast_excess:
+                        max_fast_excess = excess
+            else:
+                slow_entries.append(entry)
+                if entry.target > slow_target:
+                    slow_target = entry.target
+                if weight > 0:
+                    slow_weighted_sum += entry.score * weight
+                    slow_weight += weight
+
         if not slow_entries:
             slow_entries = demand_entries
-
-        target_ref = max(entry.target for entry in slow_entries)
-
-        di_slow = self._weighted_average(
-            [(entry.score, entry.weight) for entry in slow_entries]
-        )
-        di_fast = self._weighted_average(
-            [(entry.score, entry.weight) for entry in fast_entries]
-        )
-        if not fast_entries:
+            slow_target = fast_target
+            slow_weighted_sum = fast_weighted_sum
+            slow_weight = fast_weight
+
+        target_ref = slow_target
+        di_slow = slow_weighted_sum / slow_weight if slow_weight > 0 else 0.0
+        if fast_count:
+            di_fast = fast_weighted_sum / fast_weight if fast_weight > 0 else 0.0
+        else:
             di_fast = di_slow
 
-        slow_mix = max(0.0, float(config.get("slow_mix_weight", 0.8)))
-        fast_mix = max(0.0, float(config.get("fast_mix_weight", 0.2)))
-        mix_total = slow_mix + fast_mix
-        if mix_total <= 0:
-            slow_mix = 1.0
-            fast_mix = 0.0
-            mix_total = 1.0
-        slow_mix /= mix_total
-        fast_mix /= mix_total
-        demand_index = (slow_mix * di_slow) + (fast_mix * di_fast)
+        demand_index = (config.slow_mix * di_slow) + (config.fast_mix * di_fast)
 
         weather_term = base_offset + flow_curve_offset
         if outside_temp is not None:
             weather_term += max(0.0, 15.0 - outside_temp) * max(0.0, weather_slope)
         flow = target_ref + weather_term
 
-        kp = max(0.0, float(config.get("kp", 1.0)))
-        trim_p = kp * demand_index
+        trim_p = config.kp * demand_index
         trim = trim_p
 
-        use_integral = bool(config.get("use_integral", False))
-        if use_integral:
-            ti_minutes = max(1.0, float(config.get("ti_minutes", 180)))
-            i_max = max(0.0, float(config.get("i_max", 1.5)))
-            self._integral += demand_index * (dt_minutes / ti_minutes)
-            self._integral = self._clamp(self._integral, 0.0, i_max)
+        if config.use_integral:
+            self._integral += demand_index * (dt_minutes / config.ti_minutes)
+            self._integral = _clamp(self._integral, 0.0, config.i_max)
             trim += self._integral
         else:
             self._integral = 0.0
 
-        fast_boost = self._compute_fast_zone_boost(
-            fast_entries=fast_entries,
-            error_deadband=float(config.get("fast_error_deadband_c", 0.4)),
-            gain=float(config.get("fast_boost_gain", 1.2)),
-            cap=float(config.get("fast_boost_cap_c", 1.2)),
-        )
+        # Boost helpers are only called when their inputs can yield a boost;
+        # both are disabled or idle on most installations.
+        fast_boost = 0.0
+        if max_fast_excess > 0.0 and config.fast_boost_gain > 0.0:
+            fast_boost = self._compute_fast_zone_boost(
+                max_excess=max_fast_excess,
+                gain=config.fast_boost_gain,
+                cap=config.fast_boost_cap,
+            )
 
-        preheat_boost = self._compute_preheat_boost(
-            enabled=bool(config.get("preheat_enabled", False)),
-            outside_temp=outside_temp,
-            forecast_outside_temp=forecast_outside_temp,
-            forecast_solar_irradiance=forecast_solar_irradiance,
-            slow_entries=slow_entries,
-            slow_di=di_slow,
-            gain=float(config.get("preheat_gain", 0.35)),
-            solar_gain_per_w_m2=float(config.get("preheat_solar_gain_per_w_m2", 0.0)),
-            cap=float(config.get("preheat_cap_c", 1.2)),
-            min_slow_di=float(config.get("preheat_min_slow_di", 0.25)),
-        )
+        preheat_boost = 0.0
+        if (
+            config.preheat_enabled
+            and outside_temp is not None
+            and forecast_outside_temp is not None
+            and di_slow >= config.preheat_min_slow_di
+        ):
+            preheat_boost = self._compute_preheat_boost(
+                enabled=True,
+                outside_temp=outside_temp,
+                forecast_outside_temp=forecast_outside_temp,
+                forecast_solar_irradiance=forecast_solar_irradiance,
+                slow_entries=slow_entries,
+                slow_di=di_slow,
+                gain=config.preheat_gain,
+                solar_gain_per_w_m2=config.preheat_solar_gain_per_w_m2,
+                cap=config.preheat_cap,
+                min_slow_di=config.preheat_min_slow_di,
+            )
 
         raw_flow = flow + trim + fast_boost + preheat_boost
         smoothed_flow = self._apply_slew_rate(raw_flow=raw_flow, now=now, config=config)
-        self._last_eval_time = now
+        self._last_eval_epoch = now
         self._last_flow = smoothed_flow
 
-        clamped_flow = self._clamp(smoothed_flow, 15.0, 35.0)
-        breakdown = {
-            "target_ref_c": round(float(target_ref), 3),
-            "di_slow": round(float(di_slow), 6),
-            "di_fast": round(float(di_fast), 6),
-            "slow_mix_weight": round(float(slow_mix), 6),
-            "fast_mix_weight": round(float(fast_mix), 6),
-            "demand_index": round(float(demand_index), 6),
-            "weather_term_c": round(float(weather_term), 3),
-            "kp": round(float(kp), 6),
-            "trim_p_c": round(float(trim_p), 3),
-            "integral_enabled": bool(use_integral),
-            "integral_c": round(float(self._integral if use_integral else 0.0), 6),
-            "fast_boost_c": round(float(fast_boost), 3),
-            "preheat_boost_c": round(float(preheat_boost), 3),
-            "flow_temp_unclamped_c": round(float(raw_flow), 3),
-            "flow_temp_smoothed_c": round(float(smoothed_flow), 3),
-            "flow_temp_c": round(float(clamped_flow), 1),
-            "clamp_min_c": 15.0,
-            "clamp_max_c": 35.0,
-        }
-        return clamped_flow, breakdown
+        return _clamp(smoothed_flow, 15.0, 35.0), _FlowTerms(
+            target_ref=target_ref,
+            di_slow=di_slow,
+            di_fast=di_fast,
+            demand_index=demand_index,
+            weather_term=weather_term,
+            trim_p=trim_p,
+            integral=self._integral,
+            fast_boost=fast_boost,
+            preheat_boost=preheat_boost,
+            raw_flow=raw_flow,
+            smoothed_flow=smoothed_flow,
+        )
 
     def _build_zone_demands(
         self,
-        zone_status: dict[str, dict[str, Any]],
+        zone_status: dict[str, ZoneStatus],
         dt_minutes: float,
-        config: dict[str, Any],
+        config: SupervisorConfig,
     ) -> list[_ZoneDemand]:
-        error_norm_max = max(0.1, float(config.get("error_norm_max", 2.0)))
-        duty_ema_minutes = max(1.0, float(config.get("duty_ema_minutes", 20)))
-
-        error_weight = max(0.0, float(config.get("error_weight", 0.6)))
-        duty_weight = max(0.0, float(config.get("duty_weight", 0.4)))
-        weight_total = error_weight + duty_weight
-        if weight_total <= 0:
-            error_weight = 1.0
-            duty_weight = 0.0
-            weight_total = 1.0
-        error_weight /= weight_total
-        duty_weight /= weight_total
-
+        error_norm_max = config.error_norm_max
+        # dt and tau are shared by every zone, so the EMA gain is computed once.
+        ema_alpha = 1.0 - math.exp(-dt_minutes / max(config.duty_ema_minutes, 1e-6))
+        error_weight = config.error_weight
+        duty_weight = config.duty_weight
+        ema_duty = self._ema_duty
+
+        # Zone status values are already coerced, clamped and normalized by
+        # HeatPumpController.update_zone_status, so they are used as-is here.
         entries: list[_ZoneDemand] = []
         for zone_name, status in zone_status.items():
-            target = status.get("target")
-            current = status.get("current")
-            if target is None or current is None:
-                continue
-
-            target_value = float(target)
-            current_value = float(current)
-            error = max(0.0, target_value - current_value)
-            normalized_error = self._clamp(error / error_norm_max, 0.0, 1.0)
-
-            raw_duty = self._clamp(float(status.get("duty_cycle", 0.0)), 0.0, 100.0)
-            filtered_duty = self._update_duty_ema(
-                zone_name=zone_name,
-                raw_duty=raw_duty,
-                dt_minutes=dt_minutes,
-                tau_minutes=duty_ema_minutes,
-            )
+            target_value = status.target
+            error = max(0.0, target_value - status.current)
+            normalized_error = error / error_norm_max
+            if normalized_error > 1.0:
+                normalized_error = 1.0
+
+            # Per-zone duty EMA, inlined to keep the loop free of method calls.
+            filtered_duty = status.duty_cycle or 0.0
+            previous = ema_duty.get(zone_name)
+            if previous is not None:
+                filtered_duty = previous + ema_alpha * (filtered_duty - previous)
+            ema_duty[zone_name] = filtered_duty
             duty_fraction = filtered_duty / 100.0
 
-            response = str(status.get("zone_response", ZONE_RESPONSE_SLOW)).lower()
-            if response not in {ZONE_RESPONSE_SLOW, ZONE_RESPONSE_FAST}:
-                response = ZONE_RESPONSE_SLOW
-
-            zone_weight = max(0.0, float(status.get("zone_flow_weight", 1.0)))
-            zone_solar_weight = max(0.0, float(status.get("zone_solar_weight", 1.0)))
             score = (error_weight * normalized_error) + (duty_weight * duty_fraction)
             entries.append(
                 _ZoneDemand(
@@ -255,54 +405,23 @@ class ProFlowSupervisor:
                     target=target_value,
                     error=error,
                     duty=duty_fraction,
-                    response=response,
-                    weight=zone_weight,
-                    solar_weight=zone_solar_weight,
+                    is_fast=status.fast_response,
+                    weight=status.zone_flow_weight,
+                    solar_weight=status.zone_solar_weight,
                     score=score,
                 )
             )
 
         return entries
 
-    def _update_duty_ema(
-        self,
-        *,
-        zone_name: str,
-        raw_duty: float,
-        dt_minutes: float,
-        tau_minutes: float,
-    ) -> float:
-        previous = self._ema_duty.get(zone_name)
-        if previous is None:
-            self._ema_duty[zone_name] = raw_duty
-            return raw_duty
-
-        alpha = 1.0 - math.exp(-dt_minutes / max(tau_minutes, 1e-6))
-        filtered = previous + alpha * (raw_duty - previous)
-        self._ema_duty[zone_name] = filtered
-        return filtered
-
+    @staticmethod
     def _compute_fast_zone_boost(
-        self,
         *,
-        fast_entries: list[_ZoneDemand],
-        error_deadband: float,
+        max_excess: float,
         gain: float,
         cap: float,
     ) -> float:
-        if not fast_entries:
-            return 0.0
-
-        excess_values = []
-        deadband = max(0.0, error_deadband)
-        for entry in fast_entries:
-            excess_error = max(0.0, entry.error - deadband)
-            excess_values.append(excess_error * entry.duty * entry.weight)
-
-        if not excess_values:
-            return 0.0
-        raw_boost = max(excess_values) * max(0.0, gain)
-        return self._clamp(raw_boost, 0.0, max(0.0, cap))
+        return _clamp(max_excess * gain, 0.0, cap)
 
     def _compute_preheat_boost(
         self,
@@ -322,11 +441,11 @@ class ProFlowSupervisor:
             return 0.0
         if outside_temp is None or forecast_outside_temp is None:
             return 0.0
-        if slow_di < max(0.0, min_slow_di):
+        if slow_di < min_slow_di:
             return 0.0
 
         cold_drop = max(0.0, outside_temp - forecast_outside_temp)
-        cold_preheat = cold_drop * max(0.0, gain)
+        cold_preheat = cold_drop * gain
 
         solar_softening = 0.0
         if forecast_solar_irradiance is not None:
@@ -339,38 +458,37 @@ class ProFlowSupervisor:
                     for entry in slow_entries
                 ]
             )
-            solar_softening = max(0.0, forecast_solar_irradiance) * max(
-                0.0, solar_gain_per_w_m2
-            ) * zone_solar_factor
+            solar_softening = (
+                max(0.0, forecast_solar_irradiance)
+                * solar_gain_per_w_m2
+                * zone_solar_factor
+            )
 
         preheat = cold_preheat - solar_softening
-        return self._clamp(preheat, 0.0, max(0.0, cap))
+        return _clamp(preheat, 0.0, cap)
 
     def _apply_slew_rate(
         self,
         *,
         raw_flow: float,
-        now: datetime,
-        config: dict[str, Any],
+        now: float,
+        config: SupervisorConfig,
     ) -> float:
-        if self._last_eval_time is None:
+        if self._last_eval_epoch is None:
             return raw_flow
 
-        dt_seconds = max(1.0, (now - self._last_eval_time).total_seconds())
-        slew_up_per_5m = max(0.0, float(config.get("slew_up_c_per_5m", 0.3)))
-        slew_down_per_5m = max(0.0, float(config.get("slew_down_c_per_5m", 0.2)))
-
-        max_up = (slew_up_per_5m / 300.0) * dt_seconds
-        max_down = (slew_down_per_5m / 300.0) * dt_seconds
+        dt_seconds = max(1.0, now - self._last_eval_epoch)
+        max_up = (config.slew_up_per_5m / 300.0) * dt_seconds
+        max_down = (config.slew_down_per_5m / 300.0) * dt_seconds
 
         lower = self._last_flow - max_down
         upper = self._last_flow + max_up
-        return self._clamp(raw_flow, lower, upper)
+        return lower if raw_flow < lower else (upper if raw_flow > upper else raw_flow)
 
-    def _get_dt_minutes(self, now: datetime) -> float:
-        if self._last_eval_time is None:
+    def _get_dt_minutes(self, now: float) -> float:
+        if self._last_eval_epoch is None:
             return 1.0
-        dt_seconds = max((now - self._last_eval_time).total_seconds(), 1.0)
+        dt_seconds = max(now - self._last_eval_epoch, 1.0)
         return dt_seconds / 60.0
 
     @staticmethod
@@ -386,6 +504,5 @@ class ProFlowSupervisor:
             return 0.0
         return weighted_sum / total_weight
 
-    @staticmethod
-    def _clamp(value: float, minimum: float, maximum: float) -> float:
-        return max(minimum, min(maximum, value))
+    # Kept for callers that still reach the helper through the class.
+    _clamp = staticmethod(_clamp)
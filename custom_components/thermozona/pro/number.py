@@ -7,7 +7,7 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.entity import EntityCategory
 
-from .. import DOMAIN
+from ..helpers import device_info_for, round_tenth
 
 
 class ThermozonaFlowCurveOffsetNumber(NumberEntity):
@@ -31,16 +31,15 @@ class ThermozonaFlowCurveOffsetNumber(NumberEntity):
     ) -> None:
         self._controller = controller
         self._attr_unique_id = f"{entry_id}_flow_curve_offset"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Thermozona",
-        }
-        self._attr_native_value = controller.get_flow_curve_offset()
+        self._attr_device_info = device_info_for(entry_id)
+        self._attr_native_value = round_tenth(controller.get_flow_curve_offset())
 
     async def async_added_to_hass(self) -> None:
         """Register with heat pump controller."""
         await super().async_added_to_hass()
         self._controller.register_flow_curve_offset_number(self)
+        self._attr_native_value = round_tenth(self._controller.get_flow_curve_offset())
+        self.async_write_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
         """Unregister when the entity is removed."""
@@ -58,5 +57,8 @@ class ThermozonaFlowCurveOffsetNumber(NumberEntity):
 
     def set_current_value(self, value: float) -> None:
         """Update state from controller (used on reset/reload)."""
-        self._attr_native_value = round(value, 1)
+        rounded = round_tenth(value)
+        if rounded == self._attr_native_value:
+            return
+        self._attr_native_value = rounded
         self.async_write_ha_state()
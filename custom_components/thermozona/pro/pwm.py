@@ -29,6 +29,48 @@ def get_aligned_pwm_cycle_start(
     return datetime.fromtimestamp(aligned_timestamp, tz=timezone.utc)
 
 
+class PwmCycleAligner:
+    """Memoize the aligned PWM cycle start until the next cycle boundary."""
+
+    __slots__ = ("_key", "_start", "_start_timestamp", "_end_timestamp")
+
+    def __init__(self) -> None:
+        self._key: tuple[int, int, int] | None = None
+        self._start: datetime | None = None
+        self._start_timestamp = 0.0
+        self._end_timestamp = 0.0
+
+    def get_cycle_start(
+        self,
+        *,
+        now: datetime,
+        cycle_time_minutes: int,
+        zone_index: int,
+        zone_count: int,
+    ) -> datetime:
+        """Return the aligned cycle start, reusing it within the same cycle."""
+        key = (cycle_time_minutes, zone_index, zone_count)
+        timestamp = now.timestamp()
+        if (
+            self._start is not None
+            and key == self._key
+            and self._start_timestamp <= timestamp < self._end_timestamp
+        ):
+            return self._start
+
+        start = get_aligned_pwm_cycle_start(
+            now=now,
+            cycle_time_minutes=cycle_time_minutes,
+            zone_index=zone_index,
+            zone_count=zone_count,
+        )
+        self._key = key
+        self._start = start
+        self._start_timestamp = start.timestamp()
+        self._end_timestamp = self._start_timestamp + max(60, cycle_time_minutes * 60)
+        return start
+
+
 def calculate_pwm_duty(
     *,
     target_temperature: float,
@@ -71,26 +113,28 @@ def calculate_on_time_minutes(
     was_active: bool,
 ) -> float:
     """Calculate PWM on-time for the cycle based on PI output and limits."""
-    on_minutes = cycle_time_minutes * duty_cycle / 100
-    off_minutes = cycle_time_minutes - on_minutes
+    cycle = float(cycle_time_minutes)
+    min_on = float(min_on_time_minutes)
+    min_off = float(min_off_time_minutes)
 
-    if 0 < on_minutes < min_on_time_minutes:
-        on_minutes = 0 if duty_cycle < 5 else float(min_on_time_minutes)
-        off_minutes = cycle_time_minutes - on_minutes
+    on_minutes = cycle * duty_cycle / 100
+    off_minutes = cycle - on_minutes
 
-    if 0 < off_minutes < min_off_time_minutes:
-        off_minutes = 0 if duty_cycle > 95 else float(min_off_time_minutes)
-        on_minutes = cycle_time_minutes - off_minutes
+    if 0.0 < on_minutes < min_on:
+        on_minutes = 0.0 if duty_cycle < 5 else min_on
+        off_minutes = cycle - on_minutes
 
-    if was_active and 0 < off_minutes < min_off_time_minutes:
-        on_minutes = float(cycle_time_minutes)
+    if 0.0 < off_minutes < min_off:
+        off_minutes = 0.0 if duty_cycle > 95 else min_off
+        on_minutes = cycle - off_minutes
 
-    on_minutes = max(0.0, min(float(cycle_time_minutes), on_minutes))
-    if on_minutes > 0:
-        on_minutes += actuator_delay_minutes
-        on_minutes = min(on_minutes, float(cycle_time_minutes))
+    if was_active and 0.0 < off_minutes < min_off:
+        on_minutes = cycle
 
-    return on_minutes
+    if on_minutes <= 0.0:
+        return 0.0
+    on_minutes += actuator_delay_minutes
+    return cycle if on_minutes > cycle else on_minutes
 
 
 def should_circuits_be_on(
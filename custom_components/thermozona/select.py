@@ -12,6 +12,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import DOMAIN, CONF_HEAT_PUMP_MODE
 from .heat_pump import HeatPumpController
+from .helpers import device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,16 +23,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Thermozona select entities."""
-    domain_data = hass.data[DOMAIN]
-    entry_config = domain_data[config_entry.entry_id]
-
-    controllers = domain_data.setdefault("controllers", {})
-    controller = controllers.get(config_entry.entry_id)
-    if controller is None:
-        controller = HeatPumpController(hass, entry_config)
-    else:
-        controller.refresh_entry_config(entry_config)
-    controllers[config_entry.entry_id] = controller
+    entry_config = hass.data[DOMAIN][config_entry.entry_id]
+    controller: HeatPumpController = config_entry.runtime_data
 
     if entry_config.get(CONF_HEAT_PUMP_MODE):
         _LOGGER.debug(
@@ -58,6 +51,7 @@ class ThermozonaHeatPumpModeSelect(SelectEntity, RestoreEntity):
     _attr_icon = "mdi:hvac"
     _attr_should_poll = False
     _attr_entity_category = EntityCategory.CONFIG
+    _attr_options = ["auto", "heat", "cool", "off"]
 
     def __init__(
         self,
@@ -66,11 +60,7 @@ class ThermozonaHeatPumpModeSelect(SelectEntity, RestoreEntity):
     ) -> None:
         self._controller = controller
         self._attr_unique_id = f"{entry_id}_heat_pump_mode"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Thermozona",
-        }
-        self._attr_options = ["auto", "heat", "cool", "off"]
+        self._attr_device_info = device_info_for(entry_id)
         self._attr_current_option = "auto"
 
     async def async_added_to_hass(self) -> None:
@@ -98,7 +88,7 @@ class ThermozonaHeatPumpModeSelect(SelectEntity, RestoreEntity):
 
     def update_current_option(self, option: str) -> None:
         """Update the select option from the controller."""
-        if option not in self.options:
+        if option not in self.options or option == self._attr_current_option:
             return
         self._attr_current_option = option
         self.async_write_ha_state()
@@ -12,11 +12,13 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import DOMAIN
 from .heat_pump import HeatPumpController
+from .helpers import device_info_for, round_tenth
 
 _LOGGER = logging.getLogger(__name__)
 
+PUMP_STATES = frozenset({"heat", "cool", "idle"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,16 +26,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Thermozona sensor entities."""
-    domain_data = hass.data[DOMAIN]
-    entry_config = domain_data[config_entry.entry_id]
-
-    controllers = domain_data.setdefault("controllers", {})
-    controller = controllers.get(config_entry.entry_id)
-    if controller is None:
-        controller = HeatPumpController(hass, entry_config)
-    else:
-        controller.refresh_entry_config(entry_config)
-    controllers[config_entry.entry_id] = controller
+    controller: HeatPumpController = config_entry.runtime_data
 
     async_add_entities(
         [
@@ -59,10 +52,7 @@ class ThermozonaHeatPumpStatusSensor(SensorEntity):
     ) -> None:
         self._controller = controller
         self._attr_unique_id = f"{entry_id}_heat_pump_status"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Thermozona",
-        }
+        self._attr_device_info = device_info_for(entry_id)
         self._attr_native_value: str = "idle"
 
     async def async_added_to_hass(self) -> None:
@@ -78,8 +68,10 @@ class ThermozonaHeatPumpStatusSensor(SensorEntity):
 
     def update_state(self, state: str) -> None:
         """Push the latest pump state into Home Assistant."""
-        if state not in {"heat", "cool", "idle"}:
+        if state not in PUMP_STATES:
             state = "idle"
+        if state == self._attr_native_value:
+            return
         self._attr_native_value = state
         self.async_write_ha_state()
 
@@ -102,11 +94,9 @@ class ThermozonaFlowTemperatureSensor(SensorEntity):
     ) -> None:
         self._controller = controller
         self._attr_unique_id = f"{entry_id}_flow_temperature_sensor"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Thermozona",
-        }
+        self._attr_device_info = device_info_for(entry_id)
         self._attr_native_value: float | None = None
+        self._factors: dict[str, Any] = {}
 
     async def async_added_to_hass(self) -> None:
         """Register with the heat pump controller."""
@@ -121,10 +111,17 @@ class ThermozonaFlowTemperatureSensor(SensorEntity):
 
     def set_calculated_value(self, value: float) -> None:
         """Update with the latest calculated flow temperature."""
-        self._attr_native_value = round(value, 1)
+        rounded = round_tenth(value)
+        factors = self._controller.get_flow_temperature_factors()
+        if rounded == self._attr_native_value and (
+            factors is self._factors or factors == self._factors
+        ):
+            return
+        self._attr_native_value = rounded
+        self._factors = factors
         self.async_write_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return breakdown attributes for the computed flow temperature."""
-        return self._controller.get_flow_temperature_factors()
+        return self._factors
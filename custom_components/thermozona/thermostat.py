@@ -1,6 +1,7 @@
 """Thermostat entity for the Thermozona integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from datetime import datetime, timedelta, timezone
@@ -15,8 +16,8 @@ from homeassistant.components.climate import (
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change_event,
-    async_track_time_interval,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -35,19 +36,30 @@ from . import (
     DOMAIN,
 )
 from .heat_pump import HeatPumpController
+from .helpers import device_info_for
 from .pro.pwm import (
+    PwmCycleAligner,
     calculate_on_time_minutes,
     calculate_pwm_duty,
-    get_aligned_pwm_cycle_start,
     should_circuits_be_on,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=1)
+# PWM wake-ups land this far past an on/off edge so the pass sees the new slice.
+PWM_EDGE_SLACK_SECONDS = 1.0
+# Bang-bang zones react to sensor events; the watchdog only catches missed
+# ones, so it backs off while the room sits far from a switching threshold.
+WATCHDOG_MIN_INTERVAL = timedelta(minutes=1)
+WATCHDOG_INTERVAL = timedelta(minutes=15)
 DEFAULT_HYSTERESIS = 0.3
 PWM_INTEGRAL_KEY = "pwm_integral"
 PWM_TARGET_RESET_DELTA = 2.0
+# Bursts of sensor/mode events within this window share one control pass.
+CONTROL_DEBOUNCE_SECONDS = 0.3
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9_]+")
+_SLUG_REPEAT_RE = re.compile(r"__+")
 
 
 class ThermozonaThermostat(ClimateEntity, RestoreEntity):
@@ -58,6 +70,7 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         | ClimateEntityFeature.TURN_ON
         | ClimateEntityFeature.TURN_OFF
     )
+    _attr_hvac_modes = [HVACMode.AUTO, HVACMode.OFF]
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_min_temp = 5
     _attr_max_temp = 30
@@ -90,23 +103,32 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         self._attr_name = f"Thermozona {human_name}"
         self._attr_unique_id = f"thermozona_{slug_name}"
         self._zone_name = slug_name
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": "Thermozona",
-        }
-        self._circuits = circuits
+        self._attr_device_info = device_info_for(entry_id)
+        self._circuits_by_domain = self._group_circuits_by_domain(circuits)
+        self._circuits: tuple[str, ...] = tuple(
+            entity_id
+            for domain_circuits in self._circuits_by_domain.values()
+            for entity_id in domain_circuits
+        )
+        self._circuit_states: dict[str, str | None] = {}
+        self._last_written_state: tuple[Any, ...] | None = None
+        self._attributes_key: tuple[Any, ...] | None = None
+        self._attributes: dict[str, Any] = {}
         self._temp_sensor = temp_sensor
+        self._cached_temp: float | None = None
+        self._cached_temp_valid = False
+        self._cached_temp_state: Any = None
         self._attr_target_temperature = 20
         self._attr_hvac_action = HVACAction.OFF
         self._remove_update_handler = None
-        self._remove_mode_listener = None
         self._remove_temp_sensor_listener = None
         self._controller = controller
-        self._pending_control = False
-        self._reschedule_control = False
+        self._control_lock = asyncio.Lock()
+        self._control_dirty = False
+        self._control_task: asyncio.Task[None] | None = None
+        self._cancel_debounced_control = None
         self._manual_mode: HVACMode = HVACMode.AUTO
         self._effective_mode: HVACMode = HVACMode.AUTO
-        self._mode_listener_entity: str | None = None
         self._hysteresis: float = (
             hysteresis if hysteresis is not None else DEFAULT_HYSTERESIS
         )
@@ -146,6 +168,7 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         self._zone_solar_weight = max(0.0, self._zone_solar_weight)
 
         self._pwm_cycle_start: datetime | None = None
+        self._pwm_cycle_aligner = PwmCycleAligner()
         self._pwm_on_time = timedelta()
         self._pwm_integral = 0.0
         self._pwm_duty_cycle = 0.0
@@ -159,11 +182,11 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
             _LOGGER.debug(
                 "%s: Restoring state from %s", self._attr_name, last_state.state
             )
-            if ATTR_TEMPERATURE in last_state.attributes:
+            attributes = last_state.attributes
+            restored_target = attributes.get(ATTR_TEMPERATURE)
+            if restored_target is not None:
                 try:
-                    self._attr_target_temperature = float(
-                        last_state.attributes[ATTR_TEMPERATURE]
-                    )
+                    self._attr_target_temperature = float(restored_target)
                 except (TypeError, ValueError):
                     _LOGGER.warning(
                         "%s: Invalid stored temperature %s", self._attr_name, last_state
@@ -171,7 +194,7 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
             if last_state.state in (HVACMode.AUTO, HVACMode.OFF):
                 self._manual_mode = HVACMode(last_state.state)
 
-            restored_integral = last_state.attributes.get(PWM_INTEGRAL_KEY)
+            restored_integral = attributes.get(PWM_INTEGRAL_KEY)
             if restored_integral is not None:
                 try:
                     self._pwm_integral = float(restored_integral)
@@ -182,17 +205,17 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
                         restored_integral,
                     )
 
+        # PWM zones receive their stagger slot through set_pwm_zone_info.
         self._controller.register_thermostat(self)
-        self._pwm_zone_index, self._pwm_zone_count = self._controller.get_pwm_zone_info(
-            self
-        )
 
-        self._remove_update_handler = async_track_time_interval(
-            self.hass,
-            self._async_update_temp,
-            SCAN_INTERVAL,
+        # Control is driven by the temperature sensor listener below; the
+        # one-shot wake-up re-arms itself after every pass (PWM edges or the
+        # hysteresis watchdog) and starts out at the plain interval.
+        self._schedule_watchdog(
+            SCAN_INTERVAL.total_seconds()
+            if self._control_mode == CONTROL_MODE_PWM
+            else WATCHDOG_INTERVAL.total_seconds()
         )
-        await self.async_update_mode_listener()
         await self.async_update_temp_sensor_listener()
         self.async_schedule_control()
 
@@ -200,10 +223,12 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         """Run when entity will be removed."""
         if self._remove_update_handler is not None:
             self._remove_update_handler()
-        if self._remove_mode_listener is not None:
-            self._remove_mode_listener()
+            self._remove_update_handler = None
         if self._remove_temp_sensor_listener is not None:
             self._remove_temp_sensor_listener()
+        if self._cancel_debounced_control is not None:
+            self._cancel_debounced_control()
+            self._cancel_debounced_control = None
         self._controller.update_zone_status(
             self._zone_name, target=None, current=None, source=self
         )
@@ -211,7 +236,18 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        """Return the current temperature."""
+        """Return the room temperature parsed by the last control evaluation."""
+        if self._cached_temp_valid:
+            return self._cached_temp
+        return self._read_current_temperature()
+
+    def _read_current_temperature(self) -> float | None:
+        """Read and parse the temperature sensor, caching the result."""
+        self._cached_temp = self._parse_current_temperature()
+        self._cached_temp_valid = True
+        return self._cached_temp
+
+    def _parse_current_temperature(self) -> float | None:
         if not self._temp_sensor:
             _LOGGER.warning("%s: No temperature sensor configured", self._attr_name)
             return None
@@ -225,6 +261,12 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
             )
             return None
 
+        # State objects are replaced on every change, so an identical object
+        # means the previous parse (and any warning about it) still holds.
+        if temp_state is self._cached_temp_state:
+            return self._cached_temp
+        self._cached_temp_state = temp_state
+
         try:
             return float(temp_state.state)
         except (ValueError, TypeError) as exc:
@@ -239,19 +281,31 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra diagnostic state attributes."""
-        return {
-            "control_mode": self._control_mode,
-            "pwm_duty_cycle": round(self._pwm_duty_cycle, 2),
-            "pwm_on_time": round(self._pwm_on_time.total_seconds() / 60, 2),
-            "pwm_cycle_time": self._pwm_cycle_time_minutes,
-            "pwm_actuator_delay": self._pwm_actuator_delay_minutes,
-            "pwm_zone_index": self._pwm_zone_index,
-            "pwm_zone_count": self._pwm_zone_count,
-            "zone_response": self._zone_response,
-            "zone_flow_weight": round(self._zone_flow_weight, 2),
-            "zone_solar_weight": round(self._zone_solar_weight, 2),
-            PWM_INTEGRAL_KEY: round(self._pwm_integral, 4),
-        }
+        # Only the PWM runtime fields change after __init__; rebuild (and
+        # re-round) the mapping when one of them moved.
+        key = (
+            self._pwm_duty_cycle,
+            self._pwm_on_time,
+            self._pwm_zone_index,
+            self._pwm_zone_count,
+            self._pwm_integral,
+        )
+        if key != self._attributes_key:
+            self._attributes_key = key
+            self._attributes = {
+                "control_mode": self._control_mode,
+                "pwm_duty_cycle": round(self._pwm_duty_cycle, 2),
+                "pwm_on_time": round(self._pwm_on_time.total_seconds() / 60, 2),
+                "pwm_cycle_time": self._pwm_cycle_time_minutes,
+                "pwm_actuator_delay": self._pwm_actuator_delay_minutes,
+                "pwm_zone_index": self._pwm_zone_index,
+                "pwm_zone_count": self._pwm_zone_count,
+                "zone_response": self._zone_response,
+                "zone_flow_weight": round(self._zone_flow_weight, 2),
+                "zone_solar_weight": round(self._zone_solar_weight, 2),
+                PWM_INTEGRAL_KEY: round(self._pwm_integral, 4),
+            }
+        return self._attributes
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -293,33 +347,94 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         """Update temperature and control heating periodically."""
         await self._control_heating()
 
+    def _schedule_watchdog(self, delay: float) -> None:
+        """Arm the next wake-up pass, replacing any pending one."""
+        if self._remove_update_handler is not None:
+            self._remove_update_handler()
+        self._remove_update_handler = async_call_later(
+            self.hass,
+            delay,
+            self._async_update_temp,
+        )
+
+    def _watchdog_delay(self) -> float:
+        """Return seconds until the next watchdog pass for hysteresis control."""
+        longest = WATCHDOG_INTERVAL.total_seconds()
+        current = self._cached_temp
+        hysteresis = self._hysteresis
+        if current is None or hysteresis <= 0 or self._manual_mode == HVACMode.OFF:
+            return longest
+        # Distance to the nearest switching threshold (target +/- hysteresis).
+        margin = abs(abs(current - self._attr_target_temperature) - hysteresis)
+        delay = longest * margin / hysteresis
+        return max(WATCHDOG_MIN_INTERVAL.total_seconds(), min(longest, delay))
+
+    def _pwm_wakeup_delay(self) -> float:
+        """Return seconds until the next PWM on/off edge or cycle boundary."""
+        longest = WATCHDOG_INTERVAL.total_seconds()
+        cycle_start = self._pwm_cycle_start
+        if cycle_start is None or self._manual_mode == HVACMode.OFF:
+            return longest
+        now = datetime.now(timezone.utc)
+        on_end = cycle_start + self._pwm_on_time
+        if now < on_end:
+            next_edge = on_end
+        else:
+            next_edge = cycle_start + timedelta(
+                seconds=max(60, self._pwm_cycle_time_minutes * 60)
+            )
+        delay = (next_edge - now).total_seconds() + PWM_EDGE_SLACK_SECONDS
+        return max(PWM_EDGE_SLACK_SECONDS, min(longest, delay))
+
     async def _control_heating(self) -> None:
         """Control the heating based on configured strategy."""
-        if self._manual_mode == HVACMode.OFF:
+        # Service calls, the watchdog and the debounced worker all land here;
+        # serialize them so two passes never interleave across awaits.
+        try:
+            async with self._control_lock:
+                await self._async_control_pass()
+        finally:
+            # Re-arm even when the pass failed, or the one-shot wake-ups stop
+            # for good. Only while a wake-up is installed, so a pass finishing
+            # after removal does not schedule a new one.
+            if self._remove_update_handler is not None:
+                self._schedule_watchdog(
+                    self._pwm_wakeup_delay()
+                    if self._control_mode == CONTROL_MODE_PWM
+                    else self._watchdog_delay()
+                )
+
+    async def _async_control_pass(self) -> None:
+        """Run one control evaluation; callers must hold the control lock."""
+        # Read once per evaluation; current_temperature serves this value.
+        current_temp = self._read_current_temperature()
+        self._refresh_circuit_states()
+        manual_mode = self._manual_mode
+        if manual_mode == HVACMode.OFF:
             self._controller.update_zone_status(
                 self._zone_name, target=None, current=None, source=self
             )
             await self._set_circuits_state(False)
             self._attr_hvac_action = HVACAction.OFF
             self._effective_mode = HVACMode.OFF
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
             return
 
-        current_temp = self.current_temperature
         if current_temp is None:
             self._controller.update_zone_status(
                 self._zone_name, target=None, current=None, source=self
             )
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
             return
 
         active_before = self._circuits_are_active()
+        duty_before = self._current_zone_duty_hint(active_before)
         self._controller.update_zone_status(
             self._zone_name,
             target=self._attr_target_temperature,
             current=current_temp,
             active=active_before,
-            duty_cycle=self._current_zone_duty_hint(active_before),
+            duty_cycle=duty_before,
             zone_response=self._zone_response,
             zone_flow_weight=self._zone_flow_weight,
             zone_solar_weight=self._zone_solar_weight,
@@ -345,7 +460,7 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
                 zone_solar_weight=self._zone_solar_weight,
                 source=self,
             )
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
             return
 
         if self._control_mode == CONTROL_MODE_PWM:
@@ -355,23 +470,47 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
 
         self._effective_mode = effective_mode
         active_after = self._circuits_are_active()
-        self._controller.update_zone_status(
-            self._zone_name,
-            target=self._attr_target_temperature,
-            current=current_temp,
-            active=active_after,
-            duty_cycle=self._current_zone_duty_hint(active_after),
-            zone_response=self._zone_response,
-            zone_flow_weight=self._zone_flow_weight,
-            zone_solar_weight=self._zone_solar_weight,
-            source=self,
+        duty_after = self._current_zone_duty_hint(active_after)
+        # Only the active/duty fields can differ from the status reported
+        # above, so skip the refresh when the pass left them unchanged.
+        if (active_after, duty_after) != (active_before, duty_before):
+            self._controller.update_zone_status(
+                self._zone_name,
+                target=self._attr_target_temperature,
+                current=current_temp,
+                active=active_after,
+                duty_cycle=duty_after,
+                zone_response=self._zone_response,
+                zone_flow_weight=self._zone_flow_weight,
+                zone_solar_weight=self._zone_solar_weight,
+                source=self,
+            )
+        self._async_write_state_if_changed()
+
+    def _async_write_state_if_changed(self) -> None:
+        """Write state unless nothing exposed by the entity changed since last write."""
+        snapshot = (
+            self._attr_hvac_action,
+            self._manual_mode,
+            self._effective_mode,
+            self._attr_target_temperature,
+            self._cached_temp,
+            self._pwm_duty_cycle,
+            self._pwm_on_time,
+            self._pwm_integral,
+            self._pwm_zone_index,
+            self._pwm_zone_count,
         )
+        if snapshot == self._last_written_state:
+            return
+        self._last_written_state = snapshot
         self.async_write_ha_state()
 
     def _current_zone_duty_hint(self, is_active: bool) -> float:
         """Return zone demand proxy for flow-supervisor calculations."""
         if self._control_mode == CONTROL_MODE_PWM:
-            return max(0.0, min(100.0, float(self._pwm_duty_cycle)))
+            # calculate_pwm_duty already saturates the duty to 0..100.
+            return self._pwm_duty_cycle
         return 100.0 if is_active else 0.0
 
     def _resolve_effective_mode(self, pump_mode: str) -> HVACMode:
@@ -388,16 +527,17 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         effective_mode: HVACMode,
     ) -> None:
         """Original hysteresis based control."""
-        hysteresis = self._hysteresis
         target = self._attr_target_temperature
+        low = target - self._hysteresis
+        high = target + self._hysteresis
 
         if effective_mode == HVACMode.HEAT:
-            should_activate = current_temp < (target - hysteresis)
-            should_deactivate = current_temp > (target + hysteresis)
+            should_activate = current_temp < low
+            should_deactivate = current_temp > high
             active_action = HVACAction.HEATING
         else:
-            should_activate = current_temp > (target + hysteresis)
-            should_deactivate = current_temp < (target - hysteresis)
+            should_activate = current_temp > high
+            should_deactivate = current_temp < low
             active_action = HVACAction.COOLING
 
         if should_activate:
@@ -471,16 +611,18 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
 
     def _get_aligned_pwm_cycle_start(self, now: datetime) -> datetime:
         """Return cycle start aligned to fixed wall-clock PWM intervals."""
-        self._pwm_zone_index, self._pwm_zone_count = self._controller.get_pwm_zone_info(
-            self
-        )
-        return get_aligned_pwm_cycle_start(
+        return self._pwm_cycle_aligner.get_cycle_start(
             now=now,
             cycle_time_minutes=self._pwm_cycle_time_minutes,
             zone_index=self._pwm_zone_index,
             zone_count=self._pwm_zone_count,
         )
 
+    def set_pwm_zone_info(self, zone_index: int, zone_count: int) -> None:
+        """Store the PWM stagger slot pushed by the controller."""
+        self._pwm_zone_index = zone_index
+        self._pwm_zone_count = zone_count
+
     def _calculate_pwm_duty(
         self,
         current_temp: float,
@@ -511,53 +653,49 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
         if reset_integral:
             self._pwm_integral = 0.0
 
-    async def _handle_pump_mode_change(self, event) -> None:
-        """React to global heat pump mode changes."""
-        self.async_schedule_control()
-
     async def _handle_temp_sensor_change(self, event) -> None:
         """Re-evaluate control whenever the room temperature sensor changes."""
         self.async_schedule_control()
 
     def async_schedule_control(self) -> None:
-        """Schedule a control evaluation if one isn't already running."""
-        if self._pending_control:
-            self._reschedule_control = True
+        """Schedule a debounced control evaluation."""
+        if self._cancel_debounced_control is not None:
             return
+        self._cancel_debounced_control = async_call_later(
+            self.hass,
+            CONTROL_DEBOUNCE_SECONDS,
+            self._async_run_debounced_control,
+        )
 
-        async def _run() -> None:
-            try:
-                await self._control_heating()
-            finally:
-                self._pending_control = False
-                if self._reschedule_control:
-                    self._reschedule_control = False
-                    self.async_schedule_control()
-
-        self._pending_control = True
-        self._reschedule_control = False
-        self.hass.async_create_task(_run())
-
-    async def async_update_mode_listener(self) -> None:
-        """Subscribe to heat pump mode changes (internal or external)."""
-        mode_entity = self._controller.mode_entity
-
-        if self._mode_listener_entity == mode_entity:
-            return
-
-        if self._remove_mode_listener is not None:
-            self._remove_mode_listener()
-            self._remove_mode_listener = None
-
-        self._mode_listener_entity = mode_entity
-
-        if mode_entity is not None:
-            self._remove_mode_listener = async_track_state_change_event(
-                self.hass,
-                mode_entity,
-                self._handle_pump_mode_change,
+    async def _async_run_debounced_control(self, _now: datetime) -> None:
+        """Run the control evaluation once the debounce window has elapsed."""
+        self._cancel_debounced_control = None
+        self._start_control()
+
+    def _start_control(self) -> None:
+        """Queue a control evaluation; at most one runs and one stays queued."""
+        self._control_dirty = True
+        if self._control_task is None:
+            self._control_task = self.hass.async_create_task(
+                self._async_drain_control()
             )
 
+    async def _async_drain_control(self) -> None:
+        """Run control passes until no new request arrived in the meantime."""
+        try:
+            while self._control_dirty:
+                self._control_dirty = False
+                try:
+                    await self._control_heating()
+                except Exception as exc:  # pragma: no cover
+                    _LOGGER.error(
+                        "%s: Error during control evaluation: %s",
+                        self._attr_name,
+                        exc,
+                    )
+        finally:
+            self._control_task = None
+
     async def async_update_temp_sensor_listener(self) -> None:
         """Subscribe to temperature sensor updates for quick post-startup recovery."""
         if self._remove_temp_sensor_listener is not None:
@@ -573,43 +711,79 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
 
     async def _set_circuits_state(self, state: bool) -> None:
         """Set all circuits to the specified state."""
-        for circuit_entity_id in self._circuits:
-            try:
-                domain, _, _ = circuit_entity_id.partition(".")
-                if domain not in {"input_boolean", "switch"}:
-                    _LOGGER.error(
-                        "%s: Unsupported circuit entity %s (expected input_boolean.* or switch.*)",
-                        self._attr_name,
-                        circuit_entity_id,
-                    )
-                    continue
-
-                await self.hass.services.async_call(
+        service = "turn_on" if state else "turn_off"
+        desired = "on" if state else "off"
+        circuit_states = self._circuit_states
+        # One call per domain toggles the zone's circuits at once; circuits
+        # already in the requested state are left alone.
+        batches: list[tuple[str, list[str]]] = []
+        for domain, circuits in self._circuits_by_domain.items():
+            entity_ids = [
+                entity_id
+                for entity_id in circuits
+                if circuit_states.get(entity_id) != desired
+            ]
+            if entity_ids:
+                batches.append((domain, entity_ids))
+        # Domains are independent, so their blocking calls can overlap.
+        results = await asyncio.gather(
+            *(
+                self.hass.services.async_call(
                     domain,
-                    "turn_on" if state else "turn_off",
-                    {"entity_id": circuit_entity_id},
+                    service,
+                    {"entity_id": entity_ids},
                     blocking=True,
                 )
-            except Exception as exc:  # pragma: no cover
+                for domain, entity_ids in batches
+            ),
+            return_exceptions=True,
+        )
+        for (_domain, entity_ids), result in zip(batches, results):
+            if isinstance(result, BaseException):  # pragma: no cover
                 _LOGGER.error(
-                    "%s: Error setting state for circuit %s: %s",
+                    "%s: Error setting state for circuits %s: %s",
                     self._attr_name,
-                    circuit_entity_id,
-                    exc,
+                    ", ".join(entity_ids),
+                    result,
                 )
+                continue
+            # Blocking calls have completed, so the snapshot can follow along.
+            for entity_id in entity_ids:
+                circuit_states[entity_id] = desired
 
         if not state and self._manual_mode == HVACMode.OFF:
             self._attr_hvac_action = HVACAction.OFF
 
         await self._controller.async_update_heat_pump_state()
 
+    def _refresh_circuit_states(self) -> None:
+        """Snapshot circuit states once for the current control pass."""
+        states = self.hass.states
+        self._circuit_states = {
+            entity_id: state.state if (state := states.get(entity_id)) else None
+            for entity_id in self._circuits
+        }
+
     def _circuits_are_active(self) -> bool:
-        """Return True if any circuit is currently on."""
-        for circuit_entity_id in self._circuits:
-            state = self.hass.states.get(circuit_entity_id)
-            if state and state.state == "on":
-                return True
-        return False
+        """Return True if any circuit is on in the current snapshot."""
+        return "on" in self._circuit_states.values()
+
+    def _group_circuits_by_domain(
+        self, circuits: list[str]
+    ) -> dict[str, tuple[str, ...]]:
+        """Return supported circuit entities grouped by their service domain."""
+        grouped: dict[str, list[str]] = {}
+        for circuit_entity_id in dict.fromkeys(circuits):
+            domain, _, _ = circuit_entity_id.partition(".")
+            if domain not in {"input_boolean", "switch"}:
+                _LOGGER.error(
+                    "%s: Unsupported circuit entity %s (expected input_boolean.* or switch.*)",
+                    self._attr_name,
+                    circuit_entity_id,
+                )
+                continue
+            grouped.setdefault(domain, []).append(circuit_entity_id)
+        return {domain: tuple(entity_ids) for domain, entity_ids in grouped.items()}
 
     @staticmethod
     def _prettify(name: str) -> str:
@@ -620,10 +794,8 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
     @staticmethod
     def _slugify(name: str) -> str:
         """Return a slug suitable for entity IDs."""
-        value = name.lower()
-        value = re.sub(r"[^a-z0-9_]+", "_", value)
-        value = re.sub(r"__+", "_", value)
-        return value.strip("_")
+        value = _SLUG_INVALID_RE.sub("_", name.lower())
+        return _SLUG_REPEAT_RE.sub("_", value).strip("_")
 
     @property
     def control_mode(self) -> str:
@@ -633,7 +805,3 @@ class ThermozonaThermostat(ClimateEntity, RestoreEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         return HVACMode.OFF if self._manual_mode == HVACMode.OFF else HVACMode.AUTO
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        return [HVACMode.AUTO, HVACMode.OFF]
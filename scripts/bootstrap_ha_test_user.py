@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import time
@@ -29,14 +30,18 @@ HA_UNIT_SYSTEM = _env("HA_UNIT_SYSTEM", "metric")
 HA_TIME_ZONE = _env("HA_TIME_ZONE", "Europe/Amsterdam")
 HA_CURRENCY = _env("HA_CURRENCY", "EUR")
 
+_HA_URL_PARTS = urllib.parse.urlsplit(HA_URL)
+# One keep-alive connection is shared by all onboarding requests.
+_connection: http.client.HTTPConnection | None = None
 
-def _request_json(
+
+def _build_request(
     method: str,
     path: str,
     payload: dict[str, object] | None = None,
     token: str | None = None,
     form: dict[str, str] | None = None,
-) -> dict[str, object] | list[object]:
+) -> urllib.request.Request:
     headers = {"Accept": "application/json"}
 
     if form is not None:
@@ -51,33 +56,94 @@ def _request_json(
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    request = urllib.request.Request(
+    return urllib.request.Request(
         f"{HA_URL}{path}",
         data=body,
         headers=headers,
         method=method,
     )
 
-    with urllib.request.urlopen(request, timeout=10) as response:
-        raw = response.read().decode("utf-8").strip()
-        if not raw:
-            return {}
-        return json.loads(raw)
+
+def _get_connection() -> http.client.HTTPConnection:
+    global _connection
+    if _connection is None:
+        if _HA_URL_PARTS.scheme == "https":
+            _connection = http.client.HTTPSConnection(_HA_URL_PARTS.netloc, timeout=10)
+        else:
+            _connection = http.client.HTTPConnection(_HA_URL_PARTS.netloc, timeout=10)
+    return _connection
+
+
+def _close_connection() -> None:
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+
+def _send(request: urllib.request.Request) -> dict[str, object] | list[object]:
+    # A reused keep-alive socket may have been closed by the server; retry
+    # once on a fresh connection before giving up.
+    for attempt in range(2):
+        connection = _get_connection()
+        try:
+            connection.request(
+                request.get_method(),
+                request.selector,
+                body=request.data,
+                headers=dict(request.header_items()),
+            )
+            with connection.getresponse() as response:
+                raw = response.read().decode("utf-8").strip()
+            break
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            _close_connection()
+            if attempt:
+                raise
+        except (OSError, http.client.HTTPException):
+            # Drop the socket so the next request starts on a fresh connection.
+            _close_connection()
+            raise
+
+    # Redirects are not followed on the shared connection, so treat them as
+    # errors instead of parsing their body as JSON.
+    if response.status >= 300:
+        raise urllib.error.HTTPError(
+            request.full_url, response.status, response.reason, response.headers, None
+        )
+    if not raw:
+        return {}
+    return json.loads(raw)
+
+
+def _request_json(
+    method: str,
+    path: str,
+    payload: dict[str, object] | None = None,
+    token: str | None = None,
+    form: dict[str, str] | None = None,
+) -> dict[str, object] | list[object]:
+    return _send(_build_request(method, path, payload, token, form))
 
 
 def _wait_for_onboarding(timeout_seconds: int = 300) -> list[dict[str, object]]:
     deadline = time.monotonic() + timeout_seconds
     last_error = ""
+    # The poll never changes, so build it once; back off from a short first
+    # delay so a Home Assistant that is already up is detected quickly.
+    request = _build_request("GET", "/api/onboarding")
+    delay = 0.5
 
     while time.monotonic() < deadline:
         try:
-            data = _request_json("GET", "/api/onboarding")
+            data = _send(request)
             if isinstance(data, list):
                 return [item for item in data if isinstance(item, dict)]
-        except (urllib.error.URLError, TimeoutError, json.JSONDecodeError) as err:
+        except (OSError, http.client.HTTPException, json.JSONDecodeError) as err:
             last_error = str(err)
 
-        time.sleep(2)
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
 
     raise RuntimeError(f"Timed out waiting for Home Assistant onboarding API: {last_error}")
 
@@ -175,4 +241,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        _close_connection()
@@ -5,6 +5,8 @@ Usage guide:
 - Set private key via THERMOZONA_LICENSE_PRIVATE_KEY_PEM (inline PEM) or
   THERMOZONA_LICENSE_PRIVATE_KEY_PEM_PATH (path to PEM file).
 - Generate one JWT token on stdout for use as `license_key` in configuration.yaml.
+- Pass --subs-file instead of --sub to issue one token per listed subject in a
+  single run, loading the private key only once.
 
 Example:
   export THERMOZONA_LICENSE_PRIVATE_KEY_PEM_PATH=/secure/thermozona-private.pem
@@ -33,16 +35,20 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 # We intentionally do not import that module here: importing
 # `custom_components.thermozona.*` would execute `__init__.py`, which depends
 # on Home Assistant.
-PRO_LICENSE_SOURCES = {"github_sponsors", "ghs"}
-PRO_LICENSE_TIERS = {"pro", "sponsor"}
+PRO_LICENSE_SOURCES = frozenset({"github_sponsors", "ghs"})
+PRO_LICENSE_TIERS = frozenset({"pro", "sponsor"})
 PRO_LICENSE_DEFAULT_KEY_ID = "main-2026-01"
 
 PRIVATE_KEY_PEM_ENV = "THERMOZONA_LICENSE_PRIVATE_KEY_PEM"
 PRIVATE_KEY_PEM_PATH_ENV = "THERMOZONA_LICENSE_PRIVATE_KEY_PEM_PATH"
 
 
-def _b64url(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _compact_json(value: dict[str, object]) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
 
 
 def _load_crypto_modules():
@@ -101,7 +107,12 @@ def _parse_args() -> argparse.Namespace:
             "--tier pro --kid main-2026-01"
         ),
     )
-    parser.add_argument("--sub", required=True, help="Subject (user/account id)")
+    subject_group = parser.add_mutually_exclusive_group(required=True)
+    subject_group.add_argument("--sub", help="Subject (user/account id)")
+    subject_group.add_argument(
+        "--subs-file",
+        help="File with one subject per line; prints one token per line",
+    )
     parser.add_argument("--days", type=int, default=30, help="Token lifetime in days")
     parser.add_argument("--issuer", default="thermozona", help="JWT issuer claim")
     parser.add_argument(
@@ -130,19 +141,17 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> int:
-    args = _parse_args()
-    subject = args.sub.strip()
-    if not subject:
-        raise RuntimeError("--sub must not be empty")
-    if args.days <= 0:
-        raise RuntimeError("--days must be greater than zero")
-    if not args.kid.strip():
-        raise RuntimeError("--kid must not be empty")
+def _encoded_header(kid: str) -> bytes:
+    return _b64url(_compact_json({"alg": "EdDSA", "typ": "JWT", "kid": kid}))
 
-    private_key = _load_private_key_from_env()
 
-    now = int(time.time())
+def _build_token(
+    private_key,
+    args: argparse.Namespace,
+    subject: str,
+    now: int,
+    encoded_header: bytes,
+) -> str:
     payload = {
         "iss": args.issuer,
         "sub": subject,
@@ -154,14 +163,49 @@ def main() -> int:
     if args.not_before_minutes is not None:
         payload["nbf"] = now + args.not_before_minutes * 60
 
-    header = {"alg": "EdDSA", "typ": "JWT", "kid": args.kid.strip()}
-    encoded_header = _b64url(json.dumps(header, separators=(",", ":")).encode("utf-8"))
-    encoded_payload = _b64url(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
-    signing_input = f"{encoded_header}.{encoded_payload}".encode("ascii")
+    encoded_payload = _b64url(_compact_json(payload))
+    signing_input = encoded_header + b"." + encoded_payload
     signature = private_key.sign(signing_input)
 
-    token = f"{encoded_header}.{encoded_payload}.{_b64url(signature)}"
-    print(token)
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+def issue_batch(private_key, args: argparse.Namespace, subjects: list[str]) -> list[str]:
+    """Sign one token per subject with an already loaded key."""
+    now = int(time.time())
+    # Only the payload varies per subject; the header depends on kid alone.
+    encoded_header = _encoded_header(args.kid.strip())
+    return [
+        _build_token(private_key, args, subject, now, encoded_header)
+        for subject in subjects
+    ]
+
+
+def _read_subjects(path: str) -> list[str]:
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.subs_file is not None:
+        subjects = _read_subjects(args.subs_file)
+        if not subjects:
+            raise RuntimeError("--subs-file contains no subjects")
+    else:
+        subjects = [args.sub.strip()]
+        if not subjects[0]:
+            raise RuntimeError("--sub must not be empty")
+    if args.days <= 0:
+        raise RuntimeError("--days must be greater than zero")
+    if not args.kid.strip():
+        raise RuntimeError("--kid must not be empty")
+
+    # Load the key once, however many tokens are issued.
+    private_key = _load_private_key_from_env()
+
+    for token in issue_batch(private_key, args, subjects):
+        print(token)
     return 0
 
 
@@ -24,15 +24,7 @@ def _load_licensing_module():
 
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
-    try:
-        spec.loader.exec_module(module)
-    except ModuleNotFoundError as err:
-        if err.name == "cryptography":
-            raise RuntimeError(
-                "Missing dependency: cryptography. "
-                "Install with: python -m pip install cryptography"
-            ) from err
-        raise
+    spec.loader.exec_module(module)
     return module
 
 
@@ -47,7 +39,16 @@ def main() -> int:
 
     licensing = _load_licensing_module()
     validate_pro_license_key = licensing.validate_pro_license_key
-    result = validate_pro_license_key(args.token)
+    try:
+        result = validate_pro_license_key(args.token)
+    except ModuleNotFoundError as err:
+        # cryptography is imported lazily by the licensing module.
+        if err.name == "cryptography" or (err.name or "").startswith("cryptography."):
+            raise RuntimeError(
+                "Missing dependency: cryptography. "
+                "Install with: python -m pip install cryptography"
+            ) from err
+        raise
     if result.is_valid:
         print("valid")
         return 0
@@ -24,6 +24,12 @@ class _BaseEntity:
         return None
 
 
+class _SelectEntity(_BaseEntity):
+    @property
+    def options(self) -> list[str]:
+        return self._attr_options
+
+
 class _RestoreEntity:
     async def async_get_last_state(self):
         return None
@@ -119,7 +125,9 @@ class FakeServices:
         self.calls.append((domain, service, data, blocking))
         entity_id = data.get("entity_id")
         if domain in {"input_boolean", "switch"} and entity_id:
-            self._hass.states.set(entity_id, "on" if service == "turn_on" else "off")
+            entity_ids = [entity_id] if isinstance(entity_id, str) else entity_id
+            for target in entity_ids:
+                self._hass.states.set(target, "on" if service == "turn_on" else "off")
         if domain == "input_number" and service == "set_value" and entity_id:
             self._hass.states.set(entity_id, str(data.get("value")))
 
@@ -154,10 +162,37 @@ class FakeHass:
         self.services = FakeServices(self)
         self.data = {}
         self.config_entries = FakeConfigEntries()
+        self.state_listeners: list[tuple[list[str], object]] = []
 
     def async_create_task(self, coro):
         return asyncio.create_task(coro)
 
+    async def async_fire_state_change(self, entity_id: str) -> None:
+        event = types.SimpleNamespace(
+            data={"entity_id": entity_id, "new_state": self.states.get(entity_id)}
+        )
+        for entity_ids, action in list(self.state_listeners):
+            if entity_id in entity_ids:
+                result = action(event)
+                if asyncio.iscoroutine(result):
+                    await result
+
+
+def _track_state_change_event(hass, entity_ids, action):
+    listeners = getattr(hass, "state_listeners", None)
+    if listeners is None:
+        return lambda: None
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    listener = (list(entity_ids), action)
+    listeners.append(listener)
+
+    def _remove():
+        if listener in listeners:
+            listeners.remove(listener)
+
+    return _remove
+
 
 class ConfigEntry:
     def __init__(self, entry_id="entry-1", data=None):
@@ -178,6 +213,7 @@ def pytest_configure():
     core = types.ModuleType("homeassistant.core")
     core.HomeAssistant = FakeHass
     core.ServiceCall = dict
+    core.callback = lambda func: func
 
     config_entries = types.ModuleType("homeassistant.config_entries")
     config_entries.ConfigEntry = ConfigEntry
@@ -206,8 +242,9 @@ def pytest_configure():
     restore_state.RestoreEntity = _RestoreEntity
 
     event = types.ModuleType("homeassistant.helpers.event")
-    event.async_track_state_change_event = lambda *_args, **_kwargs: (lambda: None)
+    event.async_track_state_change_event = _track_state_change_event
     event.async_track_time_interval = lambda *_args, **_kwargs: (lambda: None)
+    event.async_call_later = lambda *_args, **_kwargs: (lambda: None)
 
     climate = types.ModuleType("homeassistant.components.climate")
     climate.HVACMode = _HVACMode
@@ -219,7 +256,7 @@ def pytest_configure():
     number.NumberEntity = _BaseEntity
 
     select = types.ModuleType("homeassistant.components.select")
-    select.SelectEntity = _BaseEntity
+    select.SelectEntity = _SelectEntity
 
     sensor = types.ModuleType("homeassistant.components.sensor")
     sensor.SensorEntity = _BaseEntity
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
+import time
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
@@ -10,13 +12,18 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from custom_components.thermozona.helpers import resolve_circuits
+from custom_components.thermozona.helpers import round_tenth
+from custom_components.thermozona import heat_pump as heat_pump_module
 from custom_components.thermozona.heat_pump import HeatPumpController
 from custom_components.thermozona.licensing import is_github_sponsor_token
 from custom_components.thermozona.licensing import is_pro_license_key
 from custom_components.thermozona.licensing import PRO_LICENSE_DEFAULT_KEY_ID
 from custom_components.thermozona.licensing import validate_pro_license_key
+from custom_components.thermozona.pro.number import ThermozonaFlowCurveOffsetNumber
 from custom_components.thermozona.sensor import ThermozonaFlowTemperatureSensor
+from custom_components.thermozona.sensor import ThermozonaHeatPumpStatusSensor
 from custom_components.thermozona.select import ThermozonaHeatPumpModeSelect
+from custom_components.thermozona import thermostat as thermostat_module
 from custom_components.thermozona.thermostat import ThermozonaThermostat
 from homeassistant.components.climate import HVACAction, HVACMode
 from homeassistant.const import ATTR_TEMPERATURE
@@ -70,9 +77,6 @@ class DummyThermostat:
     def async_schedule_control(self) -> None:
         self.calls += 1
 
-    async def async_update_mode_listener(self) -> None:
-        return None
-
 
 class RecordingThermostat(ThermozonaThermostat):
     def __init__(self, *args, **kwargs):
@@ -148,6 +152,13 @@ def test_resolve_circuits_supports_new_and_legacy_keys():
     assert resolve_circuits({}) == []
 
 
+def test_round_tenth_rounds_half_away_from_zero():
+    assert round_tenth(27.34) == 27.3
+    assert round_tenth(27.35) == 27.4
+    assert round_tenth(-2.25) == -2.3
+    assert round_tenth(0.0) == 0.0
+
+
 def test_pro_license_key_requires_sponsor_token():
     assert is_pro_license_key(_valid_sponsor_token()) is True
     assert is_pro_license_key("TZPRO-AB12-CD34-EF56") is False
@@ -249,6 +260,65 @@ def test_github_sponsor_token_rejects_wrong_signature():
     assert validate_pro_license_key(forged).reason == "invalid_signature"
 
 
+def test_expired_token_is_rejected_before_signature_verification(monkeypatch):
+    from custom_components.thermozona import licensing
+
+    now = int(datetime.now(timezone.utc).timestamp())
+    expired = _jwt(
+        {
+            "iss": "thermozona",
+            "sub": "user-1",
+            "src": "github_sponsors",
+            "tier": "pro",
+            "iat": now - 7200,
+            "exp": now - 1,
+        }
+    )
+
+    def _fail(*_args):
+        raise AssertionError("signature should not be verified")
+
+    monkeypatch.setattr(licensing, "_verify_signature", _fail)
+    assert validate_pro_license_key(expired).reason == "token_expired"
+    unhashable_issuer = _jwt({"iss": ["thermozona"], "exp": now + 60})
+    assert validate_pro_license_key(unhashable_issuer).reason == "invalid_issuer"
+
+
+def test_successful_license_validation_is_memoized(monkeypatch):
+    from custom_components.thermozona import licensing
+
+    token = _valid_sponsor_token()
+    assert validate_pro_license_key(token).is_valid is True
+
+    monkeypatch.setattr(licensing, "_load_public_keys", lambda: None)
+    assert validate_pro_license_key(token).is_valid is True
+
+    monkeypatch.setenv("THERMOZONA_LICENSE_PUBLIC_KEY_PEM", "rotated")
+    assert validate_pro_license_key(token).reason == "public_key_load_failed"
+
+
+def test_public_keyring_is_parsed_once_per_key_configuration(monkeypatch):
+    from custom_components.thermozona import licensing
+
+    monkeypatch.setattr(licensing, "_KEYRING_CACHE", None)
+    original = licensing._load_single_public_key
+    parsed = []
+
+    def _record(public_pem):
+        parsed.append(public_pem)
+        return original(public_pem)
+
+    monkeypatch.setattr(licensing, "_load_single_public_key", _record)
+
+    first = licensing._load_public_keys()
+    assert licensing._load_public_keys() is first
+    assert parsed == [TEST_LICENSE_PUBLIC_PEM]
+
+    monkeypatch.setenv("THERMOZONA_LICENSE_PUBLIC_KEY_PEM", "rotated")
+    assert licensing._load_public_keys() is None
+    assert parsed == [TEST_LICENSE_PUBLIC_PEM, "rotated"]
+
+
 def test_github_sponsor_token_validation_reasons():
     now = int(datetime.now(timezone.utc).timestamp())
     malformed = "not-a-jwt"
@@ -296,6 +366,10 @@ def test_github_sponsor_token_validation_reasons():
     )
 
     assert validate_pro_license_key(malformed).reason == "malformed_token"
+    assert validate_pro_license_key("a.b.c").reason == "malformed_token"
+    assert validate_pro_license_key("\u00e9.e30.AA").reason == "malformed_token"
+    assert validate_pro_license_key("e30.e30.A+/=").reason == "malformed_token"
+    assert validate_pro_license_key("e30.e30." + "A" * 5000).reason == "malformed_token"
     assert validate_pro_license_key(wrong_issuer).reason == "invalid_issuer"
     assert validate_pro_license_key(expired).reason == "token_expired"
     assert validate_pro_license_key(unknown_kid).reason == "unknown_kid"
@@ -316,6 +390,56 @@ def test_auto_mode_and_flow_temperature_calculation_uses_zone_status():
     assert 15 <= cool_flow <= 25
 
 
+def test_auto_mode_average_tracks_zone_updates_and_removals():
+    controller = HeatPumpController(SimpleNamespace(states=None), _config())
+    controller.update_zone_status("living", target=21, current=23)
+    controller.update_zone_status("bedroom", target=19, current=18.5)
+    # Average delta is +0.75, so the pump leans towards cooling.
+    assert controller.determine_auto_mode() == HVACMode.COOL
+
+    controller.update_zone_status("living", target=21, current=20)
+    assert controller.determine_auto_mode() == HVACMode.HEAT
+
+    controller.update_zone_status("bedroom", target=None, current=None)
+    controller.update_zone_status("living", target=21, current=21.1)
+    # Inside the deadband the previous decision is kept.
+    assert controller.determine_auto_mode() == HVACMode.HEAT
+
+    controller.update_zone_status("living", target=None, current=None)
+    assert controller._delta_sum == 0.0
+    assert controller.determine_auto_mode() == HVACMode.HEAT
+
+
+def test_flow_target_range_prefers_active_zones():
+    controller = HeatPumpController(SimpleNamespace(states=None), _config())
+    assert controller._relevant_target_range() is None
+
+    controller.update_zone_status("living", target=22, current=21, active=False)
+    controller.update_zone_status("bedroom", target=18, current=17, active=False)
+    assert controller._relevant_target_range() == (18.0, 22.0)
+
+    controller.update_zone_status("bath", target=20, current=19, active=True)
+    assert controller._relevant_target_range() == (20.0, 20.0)
+
+
+def test_entities_share_device_and_static_attributes(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    status = ThermozonaHeatPumpStatusSensor("entry-1", controller)
+    flow = ThermozonaFlowTemperatureSensor("entry-1", controller)
+    first = ThermozonaHeatPumpModeSelect("entry-1", controller)
+    second = ThermozonaHeatPumpModeSelect("entry-1", controller)
+
+    assert status._attr_device_info == {
+        "identifiers": {("thermozona", "entry-1")},
+        "name": "Thermozona",
+    }
+    assert first._attr_device_info == flow._attr_device_info
+    # Each entity owns its dict, so mutating one cannot leak into the others.
+    assert first._attr_device_info is not status._attr_device_info
+    assert first.options is second.options
+    assert "_attr_options" not in vars(first)
+
+
 @pytest.mark.asyncio
 async def test_flow_temperature_sensor_exposes_breakdown_attributes(fake_hass):
     controller = HeatPumpController(fake_hass, _config(flow_mode="simple"))
@@ -335,6 +459,38 @@ async def test_flow_temperature_sensor_exposes_breakdown_attributes(fake_hass):
     assert attrs["flow_temp_c"] == pytest.approx(sensor._attr_native_value, abs=0.01)
 
 
+def test_flow_temperature_sensor_rounds_half_away_from_zero(fake_hass):
+    controller = HeatPumpController(fake_hass, _config(flow_mode="simple"))
+    sensor = ThermozonaFlowTemperatureSensor("entry-1", controller)
+
+    sensor.set_calculated_value(27.25)
+
+    assert sensor._attr_native_value == round_tenth(27.25) == 27.3
+
+
+@pytest.mark.asyncio
+async def test_flow_temperature_sensor_skips_unchanged_writes(fake_hass):
+    controller = HeatPumpController(fake_hass, _config(flow_mode="simple"))
+    sensor = ThermozonaFlowTemperatureSensor("entry-1", controller)
+    writes: list[float | None] = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor._attr_native_value)
+    controller.register_flow_temperature_sensor(sensor)
+
+    fake_hass.states.set("sensor.outside", "10")
+    controller.update_zone_status("living", target=21.0, current=20.0, active=True)
+
+    await controller._async_set_flow_temperature()
+    factors = controller.get_flow_temperature_factors()
+    await controller._async_set_flow_temperature()
+    assert len(writes) == 1
+    assert controller.get_flow_temperature_factors() is factors
+    assert sensor.extra_state_attributes is factors
+
+    fake_hass.states.set("sensor.outside", "5")
+    await controller._async_set_flow_temperature()
+    assert len(writes) == 2
+
+
 def test_pro_flow_mode_without_license_falls_back_to_simple(fake_hass):
     controller = HeatPumpController(
         fake_hass,
@@ -405,6 +561,101 @@ def test_pro_flow_supervisor_prioritizes_slow_zones(fake_hass):
     assert flow_pro >= 23.0
 
 
+def test_pro_supervisor_uses_injected_tick_time(fake_hass):
+    controller = HeatPumpController(fake_hass, _config(flow_mode="pro_supervisor"))
+    controller.update_zone_status("living", target=21.0, current=20.0, active=True)
+
+    controller.determine_flow_temperature(
+        HVACMode.HEAT, outside_temp=10, now_epoch=1_700_000_000.0
+    )
+
+    assert controller._pro_flow_supervisor._last_eval_epoch == 1_700_000_000.0
+
+
+def test_update_zone_status_rechecks_auto_mode_only_on_temperature_change(
+    fake_hass, monkeypatch
+):
+    controller = HeatPumpController(fake_hass, _config())
+    checks = 0
+    original = controller.determine_auto_mode
+
+    def _counting_auto_mode():
+        nonlocal checks
+        checks += 1
+        return original()
+
+    monkeypatch.setattr(controller, "determine_auto_mode", _counting_auto_mode)
+
+    controller.update_zone_status("living", target=21, current=19, active=False)
+    controller.update_zone_status(
+        "living", target=21, current=19, active=True, duty_cycle=60
+    )
+    assert checks == 1
+
+    controller.update_zone_status("living", target=21, current=19.5, active=True)
+    controller.update_zone_status("living", target=None, current=None)
+    controller.update_zone_status("living", target=None, current=None)
+    assert checks == 3
+
+
+def test_update_zone_status_normalizes_fields_in_place(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    controller.update_zone_status(
+        "living", target=21, current=19, active=True, zone_response="TURBO"
+    )
+    status = controller._zone_status["living"]
+
+    controller.update_zone_status("living", target=22, current=20, duty_cycle=140)
+
+    assert controller._zone_status["living"] is status
+    assert status.target == 22.0
+    assert status.duty_cycle == 100.0
+    assert status.fast_response is False
+    assert status.active is True
+
+
+@pytest.mark.asyncio
+async def test_pro_flow_skips_breakdown_without_flow_sensor(fake_hass, monkeypatch):
+    controller = HeatPumpController(fake_hass, _config(flow_mode="pro_supervisor"))
+    fake_hass.states.set("sensor.outside", "10")
+    controller.update_zone_status("living", target=21.0, current=20.0, active=True)
+
+    def _fail(**_kwargs):
+        raise AssertionError("breakdown should not be built without a flow sensor")
+
+    monkeypatch.setattr(
+        controller._pro_flow_supervisor, "compute_heating_flow_with_breakdown", _fail
+    )
+
+    await controller._async_set_flow_temperature()
+
+    assert controller._last_flow_temp is not None
+    assert controller.get_flow_temperature_factors() == {}
+
+
+def test_pro_flow_supervisor_uses_fast_zones_when_no_slow_zone(fake_hass):
+    controller = HeatPumpController(
+        fake_hass,
+        _config(flow_mode="pro_supervisor", pro_flow={"fast_boost_gain": 0.0}),
+    )
+    controller.update_zone_status(
+        "fast_zone",
+        target=22,
+        current=21,
+        active=True,
+        duty_cycle=50,
+        zone_response="fast",
+    )
+
+    _, factors = controller.determine_flow_temperature_with_factors(
+        HVACMode.HEAT, outside_temp=15
+    )
+
+    assert factors["target_ref_c"] == 22.0
+    assert factors["di_fast"] == factors["di_slow"]
+    assert factors["di_slow"] > 0
+
+
 @pytest.mark.asyncio
 async def test_simple_flow_write_deadband_suppresses_small_changes(fake_hass):
     controller = HeatPumpController(
@@ -686,9 +937,7 @@ def test_pro_slew_rate_is_asymmetric(fake_hass):
     )
     first = controller.determine_flow_temperature(HVACMode.HEAT, outside_temp=10)
 
-    controller._pro_flow_supervisor._last_eval_time = (
-        datetime.now(timezone.utc) - timedelta(minutes=5)
-    )
+    controller._pro_flow_supervisor._last_eval_epoch = time.time() - 300
     controller._pro_flow_supervisor._last_flow = first
     controller.update_zone_status(
         "living",
@@ -701,9 +950,7 @@ def test_pro_slew_rate_is_asymmetric(fake_hass):
     )
     increased = controller.determine_flow_temperature(HVACMode.HEAT, outside_temp=10)
 
-    controller._pro_flow_supervisor._last_eval_time = (
-        datetime.now(timezone.utc) - timedelta(minutes=5)
-    )
+    controller._pro_flow_supervisor._last_eval_epoch = time.time() - 300
     controller._pro_flow_supervisor._last_flow = increased
     controller.update_zone_status(
         "living",
@@ -733,6 +980,10 @@ def test_get_operation_mode_maps_external_states(fake_hass):
 
     fake_hass.states.set("sensor.mode", "idle")
     assert controller.get_operation_mode() == "off"
+    assert controller.get_operation_mode() == "off"
+
+    fake_hass.states.set("sensor.mode", "defrost")
+    assert controller.get_operation_mode() == "auto"
 
 
 @pytest.mark.asyncio
@@ -765,6 +1016,33 @@ async def test_async_update_heat_pump_state_updates_status_sensor(fake_hass):
     assert sensor.states[-1] in {"heat", "cool"}
 
 
+@pytest.mark.asyncio
+async def test_heat_pump_updates_requested_mid_flight_are_coalesced(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    release = asyncio.Event()
+    runs = 0
+
+    async def _refresh():
+        nonlocal runs
+        runs += 1
+        await release.wait()
+
+    controller._async_refresh_heat_pump_state = _refresh
+
+    first = asyncio.create_task(controller.async_update_heat_pump_state())
+    await asyncio.sleep(0)
+    burst = [
+        asyncio.create_task(controller.async_update_heat_pump_state())
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *burst)
+
+    # One update in flight plus a single follow-up for the whole burst.
+    assert runs == 2
+
+
 @pytest.mark.asyncio
 async def test_set_mode_value_normalizes_invalid_option_and_notifies_thermostats(fake_hass):
     controller = HeatPumpController(fake_hass, _config())
@@ -780,6 +1058,91 @@ async def test_set_mode_value_normalizes_invalid_option_and_notifies_thermostats
     assert thermostat.calls == 0
 
 
+@pytest.mark.asyncio
+async def test_mode_entity_listener_is_shared_by_all_thermostats(fake_hass, monkeypatch):
+    subscriptions: list[tuple[str, object]] = []
+    removed: list[str] = []
+
+    def _track(_hass, entity_id, action):
+        if not isinstance(entity_id, str):
+            return lambda: None
+        subscriptions.append((entity_id, action))
+        return lambda: removed.append(entity_id)
+
+    monkeypatch.setattr(heat_pump_module, "async_track_state_change_event", _track)
+    controller = HeatPumpController(fake_hass, _config())
+    first = DummyThermostat()
+    second = DummyThermostat()
+
+    controller.register_thermostat(first)
+    controller.register_thermostat(second)
+    controller.register_mode_select(DummySelect())
+
+    assert [entity_id for entity_id, _ in subscriptions] == ["select.mode"]
+
+    await subscriptions[0][1](None)
+
+    assert (first.calls, second.calls) == (1, 1)
+
+    controller.unregister_thermostat(first)
+    controller.unregister_thermostat(second)
+
+    assert removed == ["select.mode"]
+
+
+@pytest.mark.asyncio
+async def test_heat_pump_demand_follows_tracked_circuit_states(fake_hass):
+    controller = HeatPumpController(
+        fake_hass,
+        _config(zones={"living": {"circuits": ["switch.zone_1", "switch.zone_2"]}}),
+    )
+    sensor = DummySensor()
+    controller.register_pump_sensor(sensor)
+    fake_hass.states.set("sensor.outside", "10")
+    fake_hass.states.set("switch.zone_1", "off")
+    fake_hass.states.set("switch.zone_2", "off")
+    controller.update_zone_status("living", target=21, current=19, active=True)
+
+    thermostat = DummyThermostat()
+    controller.register_thermostat(thermostat)
+    circuit_listener = (
+        ["switch.zone_1", "switch.zone_2"],
+        controller._handle_circuit_state_change,
+    )
+    assert circuit_listener in fake_hass.state_listeners
+    assert controller._active_circuits == set()
+
+    fake_hass.states.set("switch.zone_1", "on")
+    await fake_hass.async_fire_state_change("switch.zone_1")
+    fake_hass.states.set("switch.zone_2", "on")
+    await fake_hass.async_fire_state_change("switch.zone_2")
+    assert controller._active_circuits == {"switch.zone_1", "switch.zone_2"}
+
+    await controller.async_update_heat_pump_state()
+    assert sensor.states[-1] in {"heat", "cool"}
+
+    fake_hass.states.set("switch.zone_1", "off")
+    await fake_hass.async_fire_state_change("switch.zone_1")
+    assert controller._active_circuits == {"switch.zone_2"}
+
+    # Scanning is bypassed: demand comes from the tracked set only.
+    controller._scan_circuits_for_demand = lambda: pytest.fail("unexpected scan")
+    controller._last_any_circuit_on = None
+    await controller.async_update_heat_pump_state()
+    assert sensor.states[-1] in {"heat", "cool"}
+
+    fake_hass.states.set("switch.zone_2", "off")
+    await fake_hass.async_fire_state_change("switch.zone_2")
+    assert controller._active_circuits == set()
+
+    controller._last_any_circuit_on = None
+    await controller.async_update_heat_pump_state()
+    assert sensor.states[-1] == "idle"
+
+    controller.unregister_thermostat(thermostat)
+    assert fake_hass.state_listeners == []
+
+
 @pytest.mark.asyncio
 async def test_thermostat_controls_circuits_and_updates_hvac_action(fake_hass):
     controller = HeatPumpController(fake_hass, _config())
@@ -811,6 +1174,220 @@ async def test_thermostat_controls_circuits_and_updates_hvac_action(fake_hass):
     assert fake_hass.states.get("switch.zone_1").state == "on"
 
 
+@pytest.mark.asyncio
+async def test_bang_bang_thresholds_are_exclusive_at_sensor_resolution(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "living-room",
+        ["switch.zone_1"],
+        "sensor.living",
+        controller,
+        hysteresis=0.3,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    thermostat._attr_target_temperature = 21.0
+    thermostat._circuit_states = {"switch.zone_1": "off"}
+
+    await thermostat._control_heating_bang_bang(20.7, HVACMode.HEAT)
+    assert thermostat._attr_hvac_action == HVACAction.IDLE
+
+    await thermostat._control_heating_bang_bang(20.6, HVACMode.HEAT)
+    assert thermostat._attr_hvac_action == HVACAction.HEATING
+
+    thermostat._circuit_states = {"switch.zone_1": "off"}
+    await thermostat._control_heating_bang_bang(21.3, HVACMode.COOL)
+    assert thermostat._attr_hvac_action == HVACAction.IDLE
+
+
+@pytest.mark.asyncio
+async def test_zone_status_refreshed_only_when_pass_changes_demand(
+    fake_hass, monkeypatch
+):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "living-room",
+        ["switch.zone_1"],
+        "sensor.living",
+        controller,
+        hysteresis=0.2,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    thermostat._attr_target_temperature = 21.0
+    fake_hass.states.set("sensor.outside", "9")
+    fake_hass.states.set("sensor.living", "19")
+    fake_hass.states.set("switch.zone_1", "off")
+
+    calls = []
+    original = controller.update_zone_status
+
+    def _record(zone_name, **kwargs):
+        calls.append(kwargs.get("active"))
+        original(zone_name, **kwargs)
+
+    monkeypatch.setattr(controller, "update_zone_status", _record)
+
+    await thermostat._control_heating()
+    assert calls == [False, True]
+
+    calls.clear()
+    await thermostat._control_heating()
+    assert calls == [True]
+
+
+@pytest.mark.asyncio
+async def test_current_temperature_is_read_once_per_control_cycle(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "living-room",
+        ["switch.zone_1"],
+        "sensor.living",
+        controller,
+        hysteresis=0.2,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    fake_hass.states.set("sensor.living", "19")
+    fake_hass.states.set("switch.zone_1", "off")
+
+    await thermostat._control_heating()
+    fake_hass.states.set("sensor.living", "20.5")
+
+    assert thermostat.current_temperature == 19.0
+
+    await thermostat._control_heating()
+
+    assert thermostat.current_temperature == 20.5
+    parsed_state = thermostat._cached_temp_state
+    assert parsed_state is fake_hass.states.get("sensor.living")
+    # Same state object: the earlier parse is reused rather than redone.
+    parsed_state.state = "not-a-number"
+
+    await thermostat._control_heating()
+
+    assert thermostat._cached_temp_state is parsed_state
+    assert thermostat.current_temperature == 20.5
+
+
+@pytest.mark.asyncio
+async def test_control_requests_coalesce_into_one_queued_pass(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "living-room",
+        ["switch.zone_1"],
+        "sensor.living",
+        controller,
+        hysteresis=None,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    release = asyncio.Event()
+    passes: list[int] = []
+
+    async def _pass() -> None:
+        passes.append(len(passes))
+        await release.wait()
+
+    thermostat._async_control_pass = _pass
+
+    thermostat._start_control()
+    task = thermostat._control_task
+    await asyncio.sleep(0)
+    thermostat._start_control()
+    thermostat._start_control()
+
+    assert thermostat._control_task is task
+    assert passes == [0]
+
+    release.set()
+    await task
+
+    assert passes == [0, 1]
+    assert thermostat._control_task is None
+
+
+@pytest.mark.asyncio
+async def test_thermostat_toggles_circuits_with_one_call_per_domain(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "hall",
+        [
+            "switch.hall_a",
+            "switch.hall_b",
+            "input_boolean.hall_c",
+            "light.hall",
+            "switch.hall_a",
+        ],
+        "sensor.hall",
+        controller,
+        hysteresis=None,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+
+    assert thermostat._circuits == (
+        "switch.hall_a",
+        "switch.hall_b",
+        "input_boolean.hall_c",
+    )
+
+    await thermostat._set_circuits_state(True)
+
+    circuit_calls = [
+        call for call in fake_hass.services.calls if call[0] != "input_number"
+    ]
+    assert circuit_calls == [
+        ("switch", "turn_on", {"entity_id": ["switch.hall_a", "switch.hall_b"]}, True),
+        ("input_boolean", "turn_on", {"entity_id": ["input_boolean.hall_c"]}, True),
+    ]
+    assert fake_hass.states.get("light.hall") is None
+
+    fake_hass.services.calls.clear()
+    fake_hass.states.set("switch.hall_a", "off")
+    thermostat._refresh_circuit_states()
+    await thermostat._set_circuits_state(True)
+
+    assert [call for call in fake_hass.services.calls if call[0] != "input_number"] == [
+        ("switch", "turn_on", {"entity_id": ["switch.hall_a"]}, True),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_thermostat_turn_off_closes_circuits(fake_hass):
     controller = HeatPumpController(fake_hass, _config())
@@ -840,6 +1417,150 @@ async def test_thermostat_turn_off_closes_circuits(fake_hass):
     assert fake_hass.states.get("switch.zone_2").state == "off"
 
 
+@pytest.mark.asyncio
+async def test_zones_arm_one_shot_wakeups_instead_of_polling(fake_hass, monkeypatch):
+    delays: list[float] = []
+
+    def _call_later(_hass, delay, _action):
+        delays.append(delay)
+        return lambda: None
+
+    monkeypatch.setattr(thermostat_module, "async_call_later", _call_later)
+    controller = HeatPumpController(fake_hass, _config())
+    bang_bang = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "bedroom",
+        ["switch.zone_2"],
+        "sensor.bed",
+        controller,
+        hysteresis=None,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    pwm = _create_pwm_thermostat(fake_hass, controller)
+
+    await bang_bang.async_added_to_hass()
+    await pwm.async_added_to_hass()
+
+    debounce = thermostat_module.CONTROL_DEBOUNCE_SECONDS
+    wakeups = [delay for delay in delays if delay != debounce]
+    assert wakeups == [
+        thermostat_module.WATCHDOG_INTERVAL.total_seconds(),
+        thermostat_module.SCAN_INTERVAL.total_seconds(),
+    ]
+
+
+def test_pwm_wakeup_targets_the_next_slice_edge(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = _create_pwm_thermostat(fake_hass, controller)
+    now = datetime.now(timezone.utc)
+    thermostat._pwm_cycle_time_minutes = 15
+    thermostat._pwm_on_time = timedelta(minutes=5)
+
+    thermostat._pwm_cycle_start = now - timedelta(minutes=2)
+    assert 179 <= thermostat._pwm_wakeup_delay() <= 181
+
+    thermostat._pwm_cycle_start = now - timedelta(minutes=7)
+    assert 479 <= thermostat._pwm_wakeup_delay() <= 481
+
+    thermostat._pwm_cycle_start = None
+    assert (
+        thermostat._pwm_wakeup_delay()
+        == thermostat_module.WATCHDOG_INTERVAL.total_seconds()
+    )
+
+
+@pytest.mark.asyncio
+async def test_bang_bang_watchdog_backs_off_away_from_thresholds(
+    fake_hass, monkeypatch
+):
+    delays: list[float] = []
+
+    def _call_later(_hass, delay, _action):
+        delays.append(delay)
+        return lambda: None
+
+    monkeypatch.setattr(thermostat_module, "async_call_later", _call_later)
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "bedroom",
+        ["switch.zone_2"],
+        "sensor.bed",
+        controller,
+        hysteresis=0.3,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    thermostat._attr_target_temperature = 20.0
+    thermostat._schedule_watchdog(0)
+    fake_hass.states.set("switch.zone_2", "off")
+
+    fake_hass.states.set("sensor.bed", "20.0")
+    await thermostat._control_heating()
+    fake_hass.states.set("sensor.bed", "19.7")
+    await thermostat._control_heating()
+
+    assert delays[1] == thermostat_module.WATCHDOG_INTERVAL.total_seconds()
+    assert delays[2] == thermostat_module.WATCHDOG_MIN_INTERVAL.total_seconds()
+
+    await thermostat.async_will_remove_from_hass()
+    await thermostat._control_heating()
+
+    assert len(delays) == 3
+
+
+@pytest.mark.asyncio
+async def test_watchdog_is_rearmed_when_control_pass_fails(fake_hass, monkeypatch):
+    delays: list[float] = []
+
+    def _call_later(_hass, delay, _action):
+        delays.append(delay)
+        return lambda: None
+
+    monkeypatch.setattr(thermostat_module, "async_call_later", _call_later)
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = ThermozonaThermostat(
+        fake_hass,
+        "entry-1",
+        "bedroom",
+        ["switch.zone_2"],
+        "sensor.bed",
+        controller,
+        hysteresis=0.3,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    thermostat._schedule_watchdog(0)
+
+    async def _failing_pass():
+        raise RuntimeError("service call failed")
+
+    monkeypatch.setattr(thermostat, "_async_control_pass", _failing_pass)
+
+    with pytest.raises(RuntimeError):
+        await thermostat._control_heating()
+
+    assert delays == [0, thermostat_module.WATCHDOG_INTERVAL.total_seconds()]
+
+
 def test_name_helpers_cover_slugify_and_prettify():
     assert ThermozonaThermostat._prettify("living_room-main") == "Living room main"
     assert ThermozonaThermostat._slugify("Living Room Main!") == "living_room_main"
@@ -905,6 +1626,35 @@ def test_pwm_cycle_is_aligned_to_schedule(fake_hass):
     assert aligned == datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
 
+def test_pwm_cycle_alignment_is_reused_within_a_cycle(fake_hass, monkeypatch):
+    from custom_components.thermozona.pro import pwm
+
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = _create_pwm_thermostat(fake_hass, controller)
+    calls = []
+    original = pwm.get_aligned_pwm_cycle_start
+
+    def _counting(**kwargs):
+        calls.append(kwargs["now"])
+        return original(**kwargs)
+
+    monkeypatch.setattr(pwm, "get_aligned_pwm_cycle_start", _counting)
+
+    first = thermostat._get_aligned_pwm_cycle_start(
+        datetime(2024, 1, 1, 12, 1, 0, tzinfo=timezone.utc)
+    )
+    second = thermostat._get_aligned_pwm_cycle_start(
+        datetime(2024, 1, 1, 12, 14, 59, tzinfo=timezone.utc)
+    )
+    third = thermostat._get_aligned_pwm_cycle_start(
+        datetime(2024, 1, 1, 12, 15, 0, tzinfo=timezone.utc)
+    )
+
+    assert first == second == datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert third == datetime(2024, 1, 1, 12, 15, 0, tzinfo=timezone.utc)
+    assert len(calls) == 2
+
+
 def test_pwm_cycle_alignment_handles_non_utc_timezones(fake_hass):
     controller = HeatPumpController(fake_hass, _config())
     thermostat = _create_pwm_thermostat(fake_hass, controller)
@@ -928,7 +1678,13 @@ async def test_pwm_mode_switches_circuit_within_cycle(fake_hass):
     await thermostat.async_set_temperature(**{ATTR_TEMPERATURE: 21})
 
     assert thermostat._attr_hvac_action in {HVACAction.HEATING, HVACAction.IDLE}
-    assert thermostat.extra_state_attributes["control_mode"] == "pwm"
+    attributes = thermostat.extra_state_attributes
+    assert attributes["control_mode"] == "pwm"
+    assert thermostat.extra_state_attributes is attributes
+
+    thermostat._pwm_integral += 1.0
+
+    assert thermostat.extra_state_attributes is not attributes
 
 
 @pytest.mark.asyncio
@@ -956,6 +1712,37 @@ async def test_control_writes_state_when_temperature_is_unavailable(fake_hass):
     assert thermostat.write_calls == 1
 
 
+@pytest.mark.asyncio
+async def test_control_skips_unchanged_state_writes(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = RecordingThermostat(
+        fake_hass,
+        "entry-1",
+        "living-room",
+        ["switch.zone_1"],
+        "sensor.living",
+        controller,
+        hysteresis=0.2,
+        control_mode=None,
+        pwm_cycle_time=None,
+        pwm_min_on_time=None,
+        pwm_min_off_time=None,
+        pwm_kp=None,
+        pwm_ki=None,
+        pwm_actuator_delay=None,
+    )
+    fake_hass.states.set("sensor.living", "19")
+    fake_hass.states.set("switch.zone_1", "off")
+
+    await thermostat._control_heating()
+    await thermostat._control_heating()
+    assert thermostat.write_calls == 1
+
+    fake_hass.states.set("sensor.living", "19.1")
+    await thermostat._control_heating()
+    assert thermostat.write_calls == 2
+
+
 @pytest.mark.asyncio
 async def test_temp_sensor_listener_schedules_control(fake_hass):
     controller = HeatPumpController(fake_hass, _config())
@@ -988,6 +1775,38 @@ async def test_temp_sensor_listener_schedules_control(fake_hass):
     assert calls == 1
 
 
+@pytest.mark.asyncio
+async def test_schedule_control_coalesces_bursts(fake_hass, monkeypatch):
+    scheduled = []
+
+    def _call_later(_hass, delay, action):
+        scheduled.append((delay, action))
+        return lambda: None
+
+    monkeypatch.setattr(thermostat_module, "async_call_later", _call_later)
+    controller = HeatPumpController(fake_hass, _config())
+    thermostat = _create_pwm_thermostat(fake_hass, controller)
+    runs = 0
+
+    async def _control() -> None:
+        nonlocal runs
+        runs += 1
+
+    thermostat._control_heating = _control
+
+    for _ in range(5):
+        thermostat.async_schedule_control()
+    assert len(scheduled) == 1
+    assert scheduled[0][0] == thermostat_module.CONTROL_DEBOUNCE_SECONDS
+
+    await scheduled[0][1](datetime.now(timezone.utc))
+    await asyncio.sleep(0)
+
+    assert runs == 1
+    thermostat.async_schedule_control()
+    assert len(scheduled) == 2
+
+
 def test_flow_curve_offset_override_and_reset(fake_hass):
     controller = HeatPumpController(fake_hass, _config(flow_curve_offset=1.5))
 
@@ -1000,6 +1819,54 @@ def test_flow_curve_offset_override_and_reset(fake_hass):
     assert controller.get_flow_curve_offset() == 1.5
 
 
+@pytest.mark.asyncio
+async def test_flow_curve_offset_number_writes_state_once_when_added(fake_hass):
+    controller = HeatPumpController(fake_hass, _config(flow_curve_offset=1.5))
+    number = ThermozonaFlowCurveOffsetNumber("entry-1", controller)
+    writes: list[float | None] = []
+    number.async_write_ha_state = lambda: writes.append(number.native_value)
+
+    await number.async_added_to_hass()
+    assert writes == [1.5]
+
+    controller.set_flow_curve_offset(2.0)
+    assert writes == [1.5, 2.0]
+
+    controller.set_flow_curve_offset(2.0)
+    assert writes == [1.5, 2.0]
+
+
+def test_flow_curve_offset_number_starts_from_rounded_offset(fake_hass):
+    controller = HeatPumpController(fake_hass, _config(flow_curve_offset=1.25))
+    number = ThermozonaFlowCurveOffsetNumber("entry-1", controller)
+    writes: list[float | None] = []
+    number.async_write_ha_state = lambda: writes.append(number.native_value)
+
+    assert number.native_value == 1.3
+
+    number.set_current_value(1.25)
+    assert writes == []
+
+
+def test_pump_status_and_mode_select_skip_unchanged_writes(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    sensor = ThermozonaHeatPumpStatusSensor("entry-1", controller)
+    select = ThermozonaHeatPumpModeSelect("entry-1", controller)
+    writes: list[str] = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor._attr_native_value)
+    select.async_write_ha_state = lambda: writes.append(select._attr_current_option)
+
+    sensor.update_state("idle")
+    select.update_current_option("auto")
+    assert writes == []
+
+    sensor.update_state("heat")
+    sensor.update_state("heat")
+    select.update_current_option("cool")
+    select.update_current_option("cool")
+    assert writes == ["heat", "cool"]
+
+
 def test_flow_curve_offset_is_applied_in_heating_and_cooling(fake_hass):
     controller = HeatPumpController(fake_hass, _config(flow_mode="simple", flow_curve_offset=2.0))
     controller.update_zone_status("living", target=21, current=19, active=True)
@@ -1012,13 +1879,42 @@ def test_flow_curve_offset_is_applied_in_heating_and_cooling(fake_hass):
     assert cooling == 16.5
 
 
-def test_refresh_entry_config_resets_ui_override(fake_hass):
-    controller = HeatPumpController(fake_hass, _config(flow_curve_offset=2.0))
-    controller.set_flow_curve_offset(5.0)
+@pytest.mark.asyncio
+async def test_setup_entry_creates_one_shared_controller(fake_hass, monkeypatch):
+    import custom_components.thermozona as integration
+    from custom_components.thermozona import sensor as sensor_platform
+    from conftest import ConfigEntry
+
+    async def _yaml(_hass):
+        return {"thermozona": _config(pro=False)}
+
+    monkeypatch.setattr(integration, "async_hass_config_yaml", _yaml)
+    entry = ConfigEntry()
+
+    assert await integration.async_setup_entry(fake_hass, entry)
+
+    added: list = []
+    await sensor_platform.async_setup_entry(fake_hass, entry, added.extend)
+
+    assert isinstance(entry.runtime_data, HeatPumpController)
+    assert all(entity._controller is entry.runtime_data for entity in added)
+    assert "controllers" not in fake_hass.data["thermozona"]
+
 
-    controller.refresh_entry_config(_config(flow_curve_offset=0.0))
+def test_circuit_list_is_cached_per_entry_config(fake_hass):
+    controller = HeatPumpController(fake_hass, _config())
+    circuits = controller.get_all_circuit_entities()
+
+    assert circuits == ("switch.zone_1",)
+    assert controller.get_all_circuit_entities() is circuits
 
-    assert controller.get_flow_curve_offset() == 0.0
+    # A config change reloads the entry, which builds a new controller.
+    reloaded = HeatPumpController(
+        fake_hass,
+        _config(zones={"hall": {"groups": ["switch.hall_a", "switch.hall_b"]}}),
+    )
+
+    assert reloaded.get_all_circuit_entities() == ("switch.hall_a", "switch.hall_b")
 
 
 def test_free_tier_disables_runtime_flow_curve_override(fake_hass):
@@ -1153,9 +2049,14 @@ async def test_pwm_zones_get_different_stagger_offsets(fake_hass):
     controller.register_thermostat(zone_b)
     controller.register_thermostat(zone_c)
 
-    assert controller.get_pwm_zone_info(zone_a) == (0, 3)
-    assert controller.get_pwm_zone_info(zone_b) == (1, 3)
-    assert controller.get_pwm_zone_info(zone_c) == (2, 3)
+    assert (zone_a._pwm_zone_index, zone_a._pwm_zone_count) == (0, 3)
+    assert (zone_b._pwm_zone_index, zone_b._pwm_zone_count) == (1, 3)
+    assert (zone_c._pwm_zone_index, zone_c._pwm_zone_count) == (2, 3)
+
+    controller.unregister_thermostat(zone_b)
+
+    assert (zone_a._pwm_zone_index, zone_a._pwm_zone_count) == (0, 2)
+    assert (zone_c._pwm_zone_index, zone_c._pwm_zone_count) == (2, 2)
 
 
 @pytest.mark.asyncio
@@ -1181,8 +2082,6 @@ async def test_pwm_stagger_offset_produces_different_cycle_starts(fake_hass):
 
     controller.register_thermostat(zone_a)
     controller.register_thermostat(zone_b)
-    zone_a._pwm_zone_index, zone_a._pwm_zone_count = controller.get_pwm_zone_info(zone_a)
-    zone_b._pwm_zone_index, zone_b._pwm_zone_count = controller.get_pwm_zone_info(zone_b)
 
     now = datetime(2024, 1, 1, 12, 7, 42, tzinfo=timezone.utc)
     start_a = zone_a._get_aligned_pwm_cycle_start(now)
@@ -1217,7 +2116,6 @@ async def test_pwm_stagger_covers_full_cycle(fake_hass):
 
     offsets = []
     for zone in zones:
-        zone._pwm_zone_index, zone._pwm_zone_count = controller.get_pwm_zone_info(zone)
         offsets.append(int(zone._pwm_zone_index * 16 * 60 / zone._pwm_zone_count))
 
     offsets.sort()
@@ -1252,8 +2150,9 @@ async def test_bang_bang_zones_do_not_get_pwm_index(fake_hass):
     controller.register_thermostat(pwm_zone)
     controller.register_thermostat(bang_zone)
 
-    assert controller.get_pwm_zone_info(pwm_zone) == (0, 1)
-    assert controller.get_pwm_zone_info(bang_zone) == (0, 0)
+    assert (pwm_zone._pwm_zone_index, pwm_zone._pwm_zone_count) == (0, 1)
+    assert (bang_zone._pwm_zone_index, bang_zone._pwm_zone_count) == (0, 0)
+    assert bang_zone not in controller._pwm_zone_indices
 
 
 def test_pwm_actuator_delay_extends_on_time(fake_hass):